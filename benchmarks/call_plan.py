@@ -0,0 +1,56 @@
+"""
+Microbenchmark of the dispatch overhead of server side callbacks, i.e. the time spent in the transforms rather than in
+the callback function itself, for callbacks with many inputs. The compiled call plan is compared to stacked decorators
+(one per transform), which are emulated by compiling the plan after each transform.
+
+Usage: python benchmarks/call_plan.py
+"""
+
+import timeit
+
+from dash_extensions.enrich import (
+    BlockingCallbackTransform,
+    CallbackBlueprint,
+    LoadingTransform,
+    Output,
+    State,
+    Trigger,
+    TriggerTransform,
+    _resolve_transforms,
+)
+
+
+def _function(num_inputs: int):
+    namespace: dict = {}
+    exec(f"def f({', '.join(f'x{i}' for i in range(num_inputs))}):\n    return x0", namespace)
+    return namespace["f"]
+
+
+def build(num_inputs: int, stacked: bool):
+    transforms = [TriggerTransform(), LoadingTransform(), BlockingCallbackTransform()]
+    states = [State(f"input{i}", "value") for i in range(num_inputs)]
+    callback = CallbackBlueprint(
+        Output("out", "children"), Trigger("btn", "n_clicks"), states, loading=True, blocking=True
+    )
+    callback.f = _function(num_inputs)
+    callbacks = [callback]
+    for transform in _resolve_transforms(transforms):
+        callbacks, _ = transform.apply(callbacks, [])
+        if stacked:
+            _ = callback.f  # compiles the pending steps, i.e. one wrapper per transform
+    return callback.f
+
+
+def main(number: int = 2000):
+    print(f"{'inputs':>8} {'stacked [us]':>14} {'compiled [us]':>14} {'speedup':>8}")
+    for num_inputs in [10, 100, 1000]:
+        args = [1] + list(range(num_inputs)) + [0, None]  # trigger, inputs, blocking signals
+        timings = []
+        for stacked in [True, False]:
+            f = build(num_inputs, stacked)
+            timings.append(min(timeit.repeat(lambda: f(*args), number=number, repeat=5)) / number * 1e6)
+        print(f"{num_inputs:>8} {timings[0]:>14.2f} {timings[1]:>14.2f} {timings[0] / timings[1]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
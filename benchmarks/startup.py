@@ -0,0 +1,124 @@
+"""
+Startup benchmark, i.e. the time it takes to declare and resolve (apply the transforms to) the callbacks of an app with
+10k callbacks, half of them blocking, the other half with a loading indicator. The DependencyCollection operations
+used by the transforms (append, positional access, and index lookup) are also timed for a single large collection.
+Finally, the latency of the first request is timed with and without compiling the app (i.e. resolving it) at startup,
+and the latency of repeat requests for the dependencies is compared to serializing them per request (as Dash does).
+
+Usage: python benchmarks/startup.py
+"""
+
+import tempfile
+import time
+
+import dash
+
+from dash_extensions.enrich import (
+    BlockingCallbackTransform,
+    DashBlueprint,
+    DashProxy,
+    DependencyCollection,
+    FileSystemBackend,
+    Input,
+    LoadingTransform,
+    MultiplexerTransform,
+    Output,
+    ServersideOutputTransform,
+    State,
+    Trigger,
+    TriggerTransform,
+    html,
+)
+
+
+def _transforms(cache_dir: str):
+    return [
+        TriggerTransform(),
+        BlockingCallbackTransform(),
+        LoadingTransform(),
+        MultiplexerTransform(),
+        ServersideOutputTransform(backends=[FileSystemBackend(cache_dir)]),
+    ]
+
+
+def declare(num_callbacks: int, cache_dir: str, target: DashBlueprint | DashProxy | None = None):
+    target = DashBlueprint(transforms=_transforms(cache_dir)) if target is None else target
+    for i in range(num_callbacks):
+        kwargs = dict(blocking=True) if i % 2 == 0 else dict(loading=True)
+
+        def update(x, y):
+            return x, y
+
+        update.__name__ = f"update{i}"  # the callback ids are derived from the function name
+        target.callback(
+            Output(f"output{i}", "children"),
+            Output("shared", "children"),
+            Trigger(f"button{i}", "n_clicks"),
+            Input(f"input{i}", "value"),
+            State(f"state{i}", "value"),
+            **kwargs,
+        )(update)
+    return target
+
+
+def first_request(num_callbacks: int, cache_dir: str, compile: bool) -> tuple[DashProxy, float]:
+    app = DashProxy(transforms=_transforms(cache_dir), include_global_callbacks=False)
+    app.layout = html.Div(id="shared")
+    declare(num_callbacks, cache_dir, app)
+    if compile:
+        app.compile()
+    client = app.server.test_client()
+    tic = time.perf_counter()
+    client.get("/_dash-dependencies")
+    return app, time.perf_counter() - tic
+
+
+def repeat_requests(app: DashProxy, number: int = 10) -> tuple[float, float, float]:
+    client = app.server.test_client()
+    with app.server.test_request_context():
+        tic = time.perf_counter()
+        for _ in range(number):
+            dash.Dash.dependencies(app)
+        uncached = (time.perf_counter() - tic) / number
+    tic = time.perf_counter()
+    for _ in range(number):
+        response = client.get("/_dash-dependencies", headers={"Accept-Encoding": "gzip"})
+    cached = (time.perf_counter() - tic) / number
+    headers = {"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]}
+    tic = time.perf_counter()
+    for _ in range(number):
+        client.get("/_dash-dependencies", headers=headers)
+    return uncached, cached, (time.perf_counter() - tic) / number
+
+
+def collection(num_dependencies: int):
+    dependencies = DependencyCollection([])
+    for i in range(num_dependencies):
+        dependencies.append(Input(f"input{i}", "value"))
+    for i in range(num_dependencies):
+        assert dependencies[i] is dependencies[dependencies.index(Input(f"input{i}", "value"))]
+
+
+def main(num_callbacks: int = 10000, num_dependencies: int = 10000):
+    with tempfile.TemporaryDirectory() as cache_dir:
+        run(num_callbacks, num_dependencies, cache_dir)
+
+
+def run(num_callbacks: int, num_dependencies: int, cache_dir: str):
+    tic = time.perf_counter()
+    blueprint = declare(num_callbacks, cache_dir)
+    toc = time.perf_counter()
+    blueprint._resolve_callbacks()
+    print(f"declare {num_callbacks} callbacks: {toc - tic:.2f}s, resolve: {time.perf_counter() - toc:.2f}s")
+    tic = time.perf_counter()
+    collection(num_dependencies)
+    print(f"append + index {num_dependencies} dependencies: {time.perf_counter() - tic:.2f}s")
+    _, lazy = first_request(num_callbacks, cache_dir, False)
+    app, compiled = first_request(num_callbacks, cache_dir, True)
+    print(f"first request, lazy: {lazy:.2f}s, compiled: {compiled:.2f}s")
+    uncached, cached, not_modified = repeat_requests(app)
+    print(f"dependencies, serialized: {uncached:.3f}s, cached: {cached:.3f}s, not modified: {not_modified:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
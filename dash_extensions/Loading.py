@@ -0,0 +1,72 @@
+# AUTO GENERATED FILE - DO NOT EDIT
+
+import typing  # noqa: F401
+import numbers # noqa: F401
+from typing_extensions import TypedDict, NotRequired, Literal # noqa: F401
+from dash.development.base_component import Component, _explicitize_args
+try:
+    from dash.development.base_component import ComponentType # noqa: F401
+except ImportError:
+    ComponentType = typing.TypeVar("ComponentType", bound=Component)
+
+
+class Loading(Component):
+    """A Loading component.
+The Loading component makes it possible to stop event propagation during loading.
+
+Keyword arguments:
+
+- children (a list of or a singular dash component, string or number; optional):
+    Array or single React node.
+
+- id (string; optional):
+    Unique ID to identify this component in Dash callbacks.
+
+- loading_state (dict; optional):
+    Object that holds the loading state coming from dash-renderer.
+
+    `loading_state` is a dict with keys:
+
+    - is_loading (boolean; optional):
+        Determines if the component is loading or not.
+
+    - prop_name (string; optional):
+        Holds which property is loading.
+
+    - component_name (string; optional):
+        Holds the name of the component that is loading.
+
+- preventDefault (list of strings; default ['keydown']):
+    Events for which to call preventDefault() during loading."""
+    _children_props = []
+    _base_nodes = ['children']
+    _namespace = 'dash_extensions'
+    _type = 'Loading'
+    LoadingState = TypedDict(
+        "LoadingState",
+            {
+            "is_loading": NotRequired[bool],
+            "prop_name": NotRequired[str],
+            "component_name": NotRequired[str]
+        }
+    )
+
+    @_explicitize_args
+    def __init__(
+        self,
+        children: typing.Optional[typing.Union[str, int, float, ComponentType, typing.Sequence[typing.Union[str, int, float, ComponentType]]]] = None,
+        id: typing.Optional[typing.Union[str, dict]] = None,
+        preventDefault: typing.Optional[typing.Sequence[str]] = None,
+        loading_state: typing.Optional["LoadingState"] = None,
+        **kwargs
+    ):
+        self._prop_names = ['children', 'id', 'loading_state', 'preventDefault']
+        self._valid_wildcard_attributes =            []
+        self.available_properties = ['children', 'id', 'loading_state', 'preventDefault']
+        self.available_wildcard_properties =            []
+        _explicit_args = kwargs.pop('_explicit_args')
+        _locals = locals()
+        _locals.update(kwargs)  # For wildcard attrs and excess named props
+        args = {k: _locals[k] for k in _explicit_args if k != 'children'}
+
+        super(Loading, self).__init__(children=children, **args)
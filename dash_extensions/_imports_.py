@@ -0,0 +1,27 @@
+from .BeforeAfter import BeforeAfter
+from .CycleBreaker import CycleBreaker
+from .DeferScript import DeferScript
+from .EventListener import EventListener
+from .EventSource import EventSource
+from .Keyboard import Keyboard
+from .Loading import Loading
+from .Lottie import Lottie
+from .Mermaid import Mermaid
+from .Purify import Purify
+from .SSE import SSE
+from .WebSocket import WebSocket
+
+__all__ = [
+    "BeforeAfter",
+    "CycleBreaker",
+    "DeferScript",
+    "EventListener",
+    "EventSource",
+    "Keyboard",
+    "Loading",
+    "Lottie",
+    "Mermaid",
+    "Purify",
+    "SSE",
+    "WebSocket"
+]
\ No newline at end of file
@@ -0,0 +1 @@
+!function(e,t){"object"==typeof exports&&"object"==typeof module?module.exports=t(require("react")):"function"==typeof define&&define.amd?define(["react"],t):"object"==typeof exports?exports.dash_extensions=t(require("react")):e.dash_extensions=t(e.React)}(self,e=>(()=>{"use strict";var t,n,r={295(t){t.exports=e},1635(e,t,n){n.d(t,{Cl:()=>r,YH:()=>i,sH:()=>o});var r=function(){return r=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var o in t=arguments[n])Object.prototype.hasOwnProperty.call(t,o)&&(e[o]=t[o]);return e},r.apply(this,arguments)};function o(e,t,n,r){return new(n||(n=Promise))(function(o,i){function c(e){try{u(r.next(e))}catch(e){i(e)}}function a(e){try{u(r.throw(e))}catch(e){i(e)}}function u(e){var t;e.done?o(e.value):(t=e.value,t instanceof n?t:new n(function(e){e(t)})).then(c,a)}u((r=r.apply(e,t||[])).next())})}function i(e,t){var n,r,o,i={label:0,sent:function(){if(1&o[0])throw o[1];return o[1]},trys:[],ops:[]},c=Object.create(("function"==typeof Iterator?Iterator:Object).prototype);return c.next=a(0),c.throw=a(1),c.return=a(2),"function"==typeof Symbol&&(c[Symbol.iterator]=function(){return this}),c;function a(a){return function(u){return function(a){if(n)throw new TypeError("Generator is already executing.");for(;c&&(c=0,a[0]&&(i=0)),i;)try{if(n=1,r&&(o=2&a[0]?r.return:a[0]?r.throw||((o=r.return)&&o.call(r),0):r.next)&&!(o=o.call(r,a[1])).done)return o;switch(r=0,o&&(a=[2&a[0],o.value]),a[0]){case 0:case 1:o=a;break;case 4:return i.label++,{value:a[1],done:!1};case 5:i.label++,r=a[1],a=[0];continue;case 7:a=i.ops.pop(),i.trys.pop();continue;default:if(!((o=(o=i.trys).length>0&&o[o.length-1])||6!==a[0]&&2!==a[0])){i=0;continue}if(3===a[0]&&(!o||a[1]>o[0]&&a[1]<o[3])){i.label=a[1];break}if(6===a[0]&&i.label<o[1]){i.label=o[1],o=a;break}if(o&&i.label<o[2]){i.label=o[2],i.ops.push(a);break}o[2]&&i.ops.pop(),i.trys.pop();continue}a=t.call(e,i)}catch(e){a=[6,e],r=0}finally{n=o=0}if(5&a[0])throw a[1];return{value:a[0]?a[1]:void 0,done:!0}}([a,u])}}}Object.create,Object.create,"function"==typeof SuppressedError&&SuppressedError}},o={};function i(e){var t=o[e];if(void 0!==t)return t.exports;var n=o[e]={exports:{}};return r[e].call(n.exports,n,n.exports,i),n.exports}i.m=r,i.amdO={},i.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return i.d(t,{a:t}),t},i.d=(e,t)=>{for(var n in t)i.o(t,n)&&!i.o(e,n)&&Object.defineProperty(e,n,{enumerable:!0,get:t[n]})},i.f={},i.e=e=>Promise.all(Object.keys(i.f).reduce((t,n)=>(i.f[n](e,t),t),[])),i.u=e=>({57:"async-SSE",283:"async-Lottie",349:"async-null",367:"async-BeforeAfter",531:"async-Mermaid",591:"async-Purify"}[e]+".js"),i.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),i.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),t={},n="dash_extensions:",i.l=(e,r,o,c)=>{if(t[e])t[e].push(r);else{var a,u;if(void 0!==o)for(var s=document.getElementsByTagName("script"),l=0;l<s.length;l++){var f=s[l];if(f.getAttribute("src")==e||f.getAttribute("data-webpack")==n+o){a=f;break}}a||(u=!0,(a=document.createElement("script")).charset="utf-8",i.nc&&a.setAttribute("nonce",i.nc),a.setAttribute("data-webpack",n+o),a.src=e),t[e]=[r];var d=(n,r)=>{a.onerror=a.onload=null,clearTimeout(p);var o=t[e];if(delete t[e],a.parentNode&&a.parentNode.removeChild(a),o&&o.forEach(e=>e(r)),n)return n(r)},p=setTimeout(d.bind(null,void 0,{type:"timeout",target:a}),12e4);a.onerror=d.bind(null,a.onerror),a.onload=d.bind(null,a.onload),u&&document.head.appendChild(a)}},i.r=e=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},(()=>{var e;i.g.importScripts&&(e=i.g.location+"");var t=i.g.document;if(!e&&t&&(t.currentScript&&"SCRIPT"===t.currentScript.tagName.toUpperCase()&&(e=t.currentScript.src),!e)){var n=t.getElementsByTagName("script");if(n.length)for(var r=n.length-1;r>-1&&(!e||!/^http(s?):/.test(e));)e=n[r--].src}if(!e)throw new Error("Automatic publicPath is not supported in this browser");e=e.replace(/^blob:/,"").replace(/#.*$/,"").replace(/\?.*$/,"").replace(/\/[^\/]+$/,"/"),i.p=e})();var c,a=function(){var e=document.currentScript;if(!e){for(var t=document.getElementsByTagName("script"),n=[],r=0;r<t.length;r++)n.push(t[r]);e=(n=n.filter(function(e){return!e.async&&!e.text&&!e.textContent})).slice(-1)[0]}return e};if(Object.defineProperty(i,"p",{get:(c=a().src.split("/").slice(0,-1).join("/")+"/",function(){return c})}),"undefined"!=typeof jsonpScriptSrc){var u=jsonpScriptSrc;jsonpScriptSrc=function(e){var t,n=(t=a(),/\/_dash-component-suites\//.test(t.src)),r=u(e);if(!n)return r;var o=r.split("/"),i=o.slice(-1)[0].split(".");return i.splice(1,0,"v2_0_5m1772712149"),o.splice(-1,1,i.join(".")),o.join("/")}}(()=>{var e={792:0};i.f.j=(t,n)=>{var r=i.o(e,t)?e[t]:void 0;if(0!==r)if(r)n.push(r[2]);else{var o=new Promise((n,o)=>r=e[t]=[n,o]);n.push(r[2]=o);var c=i.p+i.u(t),a=new Error;i.l(c,n=>{if(i.o(e,t)&&(0!==(r=e[t])&&(e[t]=void 0),r)){var o=n&&("load"===n.type?"missing":n.type),c=n&&n.target&&n.target.src;a.message="Loading chunk "+t+" failed.\n("+o+": "+c+")",a.name="ChunkLoadError",a.type=o,a.request=c,r[1](a)}},"chunk-"+t,t)}};var t=(t,n)=>{var r,o,[c,a,u]=n,s=0;if(c.some(t=>0!==e[t])){for(r in a)i.o(a,r)&&(i.m[r]=a[r]);u&&u(i)}for(t&&t(n);s<c.length;s++)o=c[s],i.o(e,o)&&e[o]&&e[o][0](),e[o]=0},n=self.webpackChunkdash_extensions=self.webpackChunkdash_extensions||[];n.forEach(t.bind(null,0)),n.push=t.bind(null,n.push.bind(n))})();var s={};i.r(s),i.d(s,{BeforeAfter:()=>v,CycleBreaker:()=>y,DeferScript:()=>m,EventListener:()=>h,EventSource:()=>b,Keyboard:()=>E,Loading:()=>N,Lottie:()=>j,Mermaid:()=>P,Purify:()=>S,SSE:()=>w,WebSocket:()=>C});var l=i(1635),f=i(295),d=i.n(f),p=d().lazy(function(){return i.e(367).then(i.bind(i,5767))});const v=function(e){return d().createElement(f.Suspense,{fallback:d().createElement("div",null,"Loading...")},d().createElement(p,(0,l.Cl)({},e)))},y=function(e){var t=e.src,n=e.setProps;return(0,f.useEffect)(function(){n&&n({dst:t})},[t,n]),null},m=function(e){var t=e.id,n=e.src;return(0,f.useEffect)(function(){if(n){var e=document.createElement("script");e.src=n,e.defer=!0,t&&(e.id=t),document.body.appendChild(e)}},[n,t]),null},h=function(e){var t=e.events,n=void 0===t?[{event:"keydown",props:["key","altKey","ctrlKey","shiftKey","metaKey","repeat"]}]:t,r=e.logging,o=void 0!==r&&r,i=e.children,c=e.style,a=e.className,u=e.setProps,s=e.n_events,l=void 0===s?0:s,p=e.useCapture,v=void 0!==p&&p,y=(0,f.useRef)(null),m=[],h=function(e){o&&console.log(e);var t=n.find(function(t){return t.event===e.type}),r=(t&&t.props?t.props:[]).reduce(function(t,n){return t[n]=function(e,t){for(var n=t.split(".");n.length&&(e=e[n.shift()]););return e}(e,n),t},{});u&&(u({n_events:l+1}),u({event:r}))};return(0,f.useEffect)(function(){var e,t=n.map(function(e){return e.event});return e=y.current,(m=e&&e.children&&e.children.length>0?Array.from(e.children):[document]).forEach(function(e){t.forEach(function(t){e.addEventListener(t,h,v)})}),function(){m.forEach(function(e){t.forEach(function(t){e.removeEventListener(t,h,v)})})}},[n,o,l,v,u]),d().createElement("div",{className:a,style:c,ref:y},i)},b=function(e){var t=e.close,n=e.setProps,r=e.withCredentials,o=void 0!==r&&r,i=e.url,c=(0,f.useRef)(null);return(0,f.useEffect)(function(){var e=new EventSource(i,{withCredentials:o});return c.current=e,e.onopen=function(){n&&n({readyState:EventSource.OPEN})},e.onmessage=function(e){n&&n({message:e.data})},e.onerror=function(e){n&&n({error:JSON.stringify(e)})},function(){e.close()}},[i,o,n]),(0,f.useEffect)(function(){t&&c.current&&(c.current.close(),n&&n({readyState:EventSource.CLOSED}))},[t,n]),null},E=function(e){var t=e.children,n=e.style,r=e.className,o=e.eventProps,i=void 0===o?["key","altKey","ctrlKey","shiftKey","metaKey","repeat"]:o,c=e.captureKeys,a=e.setProps,u=e.keys_pressed,s=void 0===u?{}:u,p=e.n_keydowns,v=void 0===p?0:p,y=e.n_keyups,m=void 0===y?0:y,h=e.useCapture,b=void 0!==h&&h,E=(0,f.useRef)(null),g=(0,f.useCallback)(function(e){if(!c||0===c.length)return!0;for(var t=0,n=c;t<n.length;t++){var r=n[t];if("string"!=typeof r){for(var o=!0,i=0,a=Object.entries(r);i<a.length;i++){var u=a[i],s=u[0],l=u[1];o=o&&e[s]===l}if(o)return!0}else if(r===e.key)return!0}return!1},[c]),S=(0,f.useCallback)(function(e){if(g(e)){var t=i.reduce(function(t,n){return t[n]=e[n],t},{});if(a&&(a({keydown:t}),a({n_keydowns:v+1}),t.key)){var n=(0,l.Cl)({},s);n[t.key]=t,a({keys_pressed:n})}}},[g,i,s,v,a]),k=(0,f.useCallback)(function(e){if(g(e)){var t=i.reduce(function(t,n){return t[n]=e[n],t},{});if(a&&(a({keyup:t}),a({n_keyups:m+1}),t.key)){var n=(0,l.Cl)({},s);delete n[e.key],a({keys_pressed:n})}}},[g,i,s,m,a]);return(0,f.useEffect)(function(){var e=E.current,t=e&&e.children.length>0?Array.from(e.children):[document];return t.forEach(function(e){e.addEventListener("keydown",S,b),e.addEventListener("keyup",k,b)}),function(){t.forEach(function(e){e.removeEventListener("keydown",S,b),e.removeEventListener("keyup",k,b)})}},[S,k,b]),d().createElement("div",{className:r,style:n,ref:E},t)};var g=d().lazy(function(){return i.e(591).then(i.bind(i,2125))});const S=function(e){return d().createElement(f.Suspense,{fallback:d().createElement("div",null,"Loading...")},d().createElement(g,(0,l.Cl)({},e)))};var k=d().lazy(function(){return i.e(57).then(i.bind(i,4384))});const w=function(e){return d().createElement(f.Suspense,{fallback:d().createElement("div",null,"Loading...")},d().createElement(k,(0,l.Cl)({},e)))},C=function(e){var t=e.url,n=e.protocols,r=e.timeout,o=void 0===r?1e3:r,i=e.send,c=e.setProps,a=e.state,u=void 0===a?{readyState:WebSocket.CLOSED}:a,s=(0,f.useRef)(null),d=(0,f.useRef)(),p=function(){if(t){var e=new WebSocket(t,n);s.current=e,c&&c({state:{readyState:WebSocket.CONNECTING}}),e.onopen=function(e){c&&c({state:{readyState:WebSocket.OPEN,isTrusted:e.isTrusted,timeStamp:e.timeStamp,origin:e.origin}})},e.onmessage=function(e){c&&c({message:{data:e.data,isTrusted:e.isTrusted,origin:e.origin,timeStamp:e.timeStamp}})},e.onerror=function(e){c&&c({error:JSON.stringify(e)})},e.onclose=function(e){c&&c({state:{readyState:WebSocket.CLOSED,isTrusted:e.isTrusted,timeStamp:e.timeStamp,code:e.code,reason:e.reason,wasClean:e.wasClean}})}}},v=function(){s.current&&(s.current.onopen=null,s.current.onmessage=null,s.current.onerror=null,s.current.onclose=null,s.current.close(),s.current=null)};return(0,f.useEffect)(function(){if(v(),t){p();var e=setTimeout(function(){},100);return function(){return clearTimeout(e)}}},[t,n]),(0,f.useEffect)(function(){d.current!==i&&(d.current=i,i&&c&&(0,l.sH)(void 0,void 0,void 0,function(){return(0,l.YH)(this,function(e){switch(e.label){case 0:return u.readyState!==WebSocket.CLOSED?[3,2]:(console.log("Websocket CLOSED. Attempting to reconnect..."),v(),p(),[4,new Promise(function(e){return setTimeout(e,100)})]);case 1:e.sent(),e.label=2;case 2:return u.readyState!==WebSocket.CONNECTING?[3,4]:(console.log("Websocket CONNECTING. Delaying sending message..."),[4,new Promise(function(e){return setTimeout(e,o)})]);case 3:e.sent(),e.label=4;case 4:return u.readyState===WebSocket.OPEN&&s.current?(s.current.send(i),[2]):(console.log("Websocket connection failed. Aborting."),[2])}})}))},[i,u.readyState,o]),(0,f.useEffect)(function(){return function(){v()}},[]),null};var O=d().lazy(function(){return i.e(283).then(i.bind(i,2309))});const j=function(e){return d().createElement(f.Suspense,{fallback:d().createElement("div",null,"Loading...")},d().createElement(O,(0,l.Cl)({},e)))};var L=d().lazy(function(){return Promise.all([i.e(591),i.e(531)]).then(i.bind(i,2388))});const P=function(e){return d().createElement(f.Suspense,{fallback:d().createElement("div",null,"Loading...")},d().createElement(L,(0,l.Cl)({},e)))};var _=function(e){var t=e.children,n=e.loading_state,r=e.preventDefault,o=void 0===r?["keydown"]:r,i=(0,f.useRef)(null);return(0,f.useEffect)(function(){var e=i.current,t=function(e){e.preventDefault()};return e&&(n&&n.is_loading?o.forEach(function(n){e.addEventListener(n,t,!0)}):o.forEach(function(n){e.removeEventListener(n,t,!0)})),function(){e&&o.forEach(function(n){e.removeEventListener(n,t,!0)})}},[n,o]),d().createElement("div",{ref:i},t)};_._dashprivate_isLoadingComponent=!0;const N=_;return s})());
\ No newline at end of file
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import dataclasses
 import functools
+import gzip
 import hashlib
 import inspect
+import io
 import json
 import logging
+import lzma
+import mmap
+import operator
+import os
+import pickle
 import secrets
+import sqlite3
 import struct
 import sys
+import tempfile
 import threading
+import time
 import uuid
-from collections import defaultdict
+import weakref
+import zlib
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime, timezone
 from itertools import compress
 from types import UnionType
@@ -19,6 +34,7 @@ from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, TypeVar,
 
 import dash
 import plotly
+from cachelib.serializers import BaseSerializer
 
 # Enable enrich as drop-in replacement for dash
 # noinspection PyUnresolvedReferences
@@ -46,7 +62,7 @@ from dash import (  # lgtm [py/unused-import]; noqa: F401
 from dash.dependencies import DashDependency
 from dash.exceptions import PreventUpdate
 from dataclass_wizard import asdict, fromdict
-from flask import session
+from flask import Response, has_request_context, request, session
 from flask_caching.backends import FileSystemCache, RedisCache
 from pydantic import BaseModel  # type: ignore
 
@@ -109,36 +125,48 @@ def validate_structure(structure, level=0):  # noqa: C901
 
 
 class DependencyCollection:
+    """
+    Collection of the dependencies (e.g. the inputs) of a callback, kept in the (possibly nested) structure of the
+    callback signature. The dependencies are indexed in signature order, and the index is maintained incrementally,
+    i.e. positional access is O(1), and so is appending (except for insertion at a given index).
+    """
+
+    __slots__ = ("structure", "keyword", "_index", "_items", "_positions", "_wildcards")
+
     def __init__(self, structure, keyword=None):
         self.structure = validate_structure(structure)
         self.keyword = keyword
-        self._index = None
         self._re_index()
 
     def __getitem__(self, key: int):
-        if self._index is None:
-            raise ValueError("Index not built.")
-        return self.get(self._index[key])
+        return self._items[key]
 
     def __setitem__(self, key: int, value):
-        if self._index is None:
-            raise ValueError("Index not built.")
-        return self.set(self._index[key], value)
+        self._set(self._index[key], value)
+        self._items[key] = value
+        self.invalidate()
 
     def __len__(self):
-        if self._index is None:
-            raise ValueError("Index not built.")
-        return len(self._index)
+        return len(self._items)
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        return iter(self._items)
 
     def index(self, value):
-        for i in range(len(self)):
-            if self[i] == value:
-                return i
-        return -1
+        # The lookup is built on first use (or after changes), and maintained on append.
+        if self._positions is None:
+            self._build_positions()
+        # Wildcard dependencies match other ids, i.e. they cannot be looked up by key.
+        if self._wildcards or _has_wildcard(value):
+            return next((i for i, item in enumerate(self._items) if item == value), -1)
+        i = self._positions.get(str(value))  # type: ignore[union-attr]
+        return -1 if i is None or self._items[i] != value else i
+
+    def invalidate(self):
+        """
+        Invalidate the lookup of index, which is required after modifying dependencies in place (e.g. their ids).
+        """
+        self._positions = None
 
     def get(self, multi_index):
         e = self.structure
@@ -147,32 +175,62 @@ class DependencyCollection:
         return e
 
     def set(self, multi_index, value):
-        e = self.structure
-        for i, j in enumerate(multi_index):
-            if i == len(multi_index) - 1:
-                e[j] = value  # type: ignore
+        self[self._index.index(list(multi_index))] = value
 
     def append(self, value, flex_key=None, index=None):
-        if self._index is None:
-            raise ValueError("Index not built.")
         i = len(self._index)
         if isinstance(self.structure, list):
             if index is not None:
                 self.structure.insert(index, value)
+                # The positions of the subsequent dependencies change, i.e. the index is rebuilt.
                 self._re_index()
                 return index
             else:
                 self.structure.append(value)
-                self._re_index()
+                self._extend(value, [len(self.structure) - 1])
                 return i
         if isinstance(self.structure, dict):
             flex_key = f"{DEPENDENCY_APPEND_PREFIX}{i}" if flex_key is None else flex_key
+            replace = flex_key in self.structure
             self.structure[flex_key] = value
-            self._re_index()
+            if replace:
+                self._re_index()
+            else:
+                self._extend(value, [flex_key])
             return flex_key
 
+    def _set(self, multi_index, value):
+        e = self.structure
+        for j in multi_index[:-1]:
+            e = e[j]  # type: ignore
+        e[multi_index[-1]] = value  # type: ignore
+
+    def _extend(self, value, entry):
+        index = build_index(value, entry, [])
+        items = [self.get(multi_index) for multi_index in index]
+        if self._positions is not None:
+            for i, item in enumerate(items, len(self._items)):
+                self._positions.setdefault(str(item), i)
+            self._wildcards = self._wildcards or any(_has_wildcard(item) for item in items)
+        self._index.extend(index)
+        self._items.extend(items)
+
+    def _build_positions(self):
+        self._positions = {}
+        for i, item in enumerate(self._items):
+            self._positions.setdefault(str(item), i)
+        self._wildcards = any(_has_wildcard(item) for item in self._items)
+
     def _re_index(self):
-        self._index = build_index(self.structure, [], [])
+        self._index: List[List[Any]] = []
+        self._items: List[DashDependency] = []
+        self._positions: Dict[str, int] | None = None
+        self._wildcards = False
+        self._extend(self.structure, [])
+
+
+def _has_wildcard(value: Any) -> bool:
+    return isinstance(value, DashDependency) and value.has_wildcard()
 
 
 # endregion
@@ -181,9 +239,14 @@ class DependencyCollection:
 
 
 def collect_args(args: Union[Tuple[Any], List[Any]], inputs, outputs):
+    _collect_args(args, inputs, outputs)
+    return DependencyCollection(inputs), DependencyCollection(outputs)
+
+
+def _collect_args(args: Union[Tuple[Any], List[Any]], inputs, outputs):
     for arg in args:
         if isinstance(arg, (list, tuple)):
-            collect_args(arg, inputs, outputs)
+            _collect_args(arg, inputs, outputs)
             continue
         if isinstance(arg, Output):
             outputs.append(arg)
@@ -193,7 +256,6 @@ def collect_args(args: Union[Tuple[Any], List[Any]], inputs, outputs):
             continue
         # If we get here, the argument was not recognized.
         raise ValueError(f"Unsupported argument: {arg}")
-    return DependencyCollection(inputs), DependencyCollection(outputs)
 
 
 class DummyDependency(DashDependency):
@@ -205,6 +267,188 @@ class DummyDependency(DashDependency):
         super().__init__(component_id, component_property)
 
 
+class CallPlan:
+    """
+    Plan for invoking the function of a (server side) callback. Rather than wrapping the function in a decorator per
+    transform, transforms record steps on the plan (inputs to skip, argument and output mappers, exception guards, and
+    outputs to append), which are compiled into a single function. The index maps for skipping inputs are computed
+    once per callback, i.e. the arguments are remapped, and the outputs appended, in one pass per call. Steps recorded
+    later wrap the ones recorded before, as if they were decorators.
+    """
+
+    def __init__(self):
+        self.steps: List[Tuple[str, Any]] = []
+
+    def skip_inputs(self, keys: List[Any], handler: Callable[[List[Any]], None] | None = None) -> CallPlan:
+        """
+        Skip the inputs with the given keys (positions, or flex keys). The handler (if any) is invoked with the values
+        of the skipped inputs before the function is called.
+        """
+        self.steps.append(("skip", (list(keys), handler)))
+        return self
+
+    def map_args(self, func: Callable[[List[Any], Dict[str, Any]], None]) -> CallPlan:
+        """
+        Map the (positional and keyword) arguments in place before the function is called.
+        """
+        self.steps.append(("args", func))
+        return self
+
+    def map_outputs(self, func: Callable[[Any], Any]) -> CallPlan:
+        """
+        Map the outputs of the function.
+        """
+        self.steps.append(("outputs", func))
+        return self
+
+    def guard(self, fallback: Callable[[Exception], Any]) -> CallPlan:
+        """
+        If the function (or a step recorded before) raises, the outputs are replaced by fallback(exception).
+        """
+        self.steps.append(("guard", fallback))
+        return self
+
+    def append_output(self, key: Any, value: Callable[[], Any], single_output: bool) -> CallPlan:
+        """
+        Append the output value() to the outputs of the function (under the flex key, if the outputs are a dict).
+        """
+        self.steps.append(("append", (key, value, single_output)))
+        return self
+
+    def compile(self, f: Callable) -> Callable:
+        """
+        Compile the steps into a single function that wraps f.
+        """
+        if not self.steps:
+            return f
+        # Arguments are mapped from the outside in, outputs from the inside out.
+        ops = self._compile_outputs([step for step in self.steps if step[0] not in ("skip", "args")])
+        # If mapping an argument raises, recovery starts from the first guard recorded after the step.
+        guards = [i for i, (_, fallback) in enumerate(ops) if fallback is not None] + [len(ops)]
+        arg_steps, level = [], 0
+        for kind, step in self.steps:
+            if kind in ("skip", "args"):
+                arg_steps.append((kind, step, guards[level]))
+            level += kind == "guard"
+        arg_steps.reverse()
+        programs: Dict[int, List[Tuple[Callable, int]]] = {}
+
+        def recover(e: Exception, start: int):
+            for i in range(start, len(ops)):
+                if ops[i][1] is not None:
+                    return ops[i][1](e), i + 1
+            raise e
+
+        @functools.wraps(f)
+        def compiled(*args, **kwargs):
+            # The index maps depend only on the number of positional arguments, which is fixed per callback.
+            program = programs.get(len(args))
+            if program is None:
+                program = programs.setdefault(len(args), self._compile_args(arg_steps, len(args)))
+            args, i, start = list(args), 0, 0
+            try:
+                for op, start in program:
+                    args = op(args, kwargs)
+                start = 0
+                outputs = f(*args, **kwargs)
+            except Exception as e:
+                outputs, i = recover(e, start)
+            while i < len(ops):
+                op, _ = ops[i]
+                i += 1
+                if op is None:
+                    continue
+                try:
+                    outputs = op(outputs)
+                except Exception as e:
+                    outputs, i = recover(e, i)
+            return outputs
+
+        # Without skipped inputs, the signature is unchanged (it's used to resolve argument annotations).
+        if not any(step[0] == "skip" for step in self.steps):
+            compiled.__signature__ = inspect.signature(f)  # type: ignore[attr-defined]
+        return compiled
+
+    @staticmethod
+    def _compile_args(steps: List[Tuple[str, Any, int]], n: int) -> List[Tuple[Callable, int]]:
+        program: List[Tuple[Callable, int]] = []
+        positions: List[int] = list(range(n))
+        captures: List[Tuple[List[Any], Any]] = []
+        captures_start = 0
+        for kind, step, start in steps + [("args", None, 0)]:
+            # Consecutive skips (covered by the same guard) are fused into a single selection.
+            if captures and (kind != "skip" or start != captures_start):
+                program.append((_select_args(positions, captures), captures_start))
+                positions, captures = list(range(len(positions))), []
+            if kind == "skip":
+                keys, handler = step
+                # Map the positions (relative to the step) to positions in the arguments of the selection.
+                items = [positions[key] if isinstance(key, int) else key for key in keys if _in_range(key, positions)]
+                positions = [position for j, position in enumerate(positions) if j not in keys]
+                captures.append((items, handler))
+                captures_start = start
+                continue
+            if step is not None:
+                program.append((_map_args(step), start))
+        return program
+
+    @staticmethod
+    def _compile_outputs(steps: List[Tuple[str, Any]]) -> List[Tuple[Callable | None, Callable | None]]:
+        ops: List[Tuple[Callable | None, Callable | None]] = []
+        appends: List[Tuple[Any, Callable[[], Any], bool]] = []
+        for kind, step in steps + [("guard", None)]:
+            if kind == "append":
+                appends.append(step)
+                continue
+            # Consecutive appends are fused.
+            if appends:
+                ops.append((_append_outputs(appends), None))
+                appends = []
+            if kind == "outputs":
+                ops.append((step, None))
+            elif step is not None:
+                ops.append((None, step))
+        return ops
+
+
+def _in_range(key: Any, positions: List[int]) -> bool:
+    return not isinstance(key, int) or key < len(positions)
+
+
+def _select_args(positions: List[int], captures: List[Tuple[List[Any], Any]]) -> Callable:
+    def select(args, kwargs):
+        for items, handler in captures:
+            values = [args[item] if isinstance(item, int) else kwargs.pop(item) for item in items]
+            if handler is not None:
+                handler(values)
+        return [args[position] for position in positions]
+
+    return select
+
+
+def _map_args(func: Callable) -> Callable:
+    def map_args(args, kwargs):
+        func(args, kwargs)
+        return args
+
+    return map_args
+
+
+def _append_outputs(appends: List[Tuple[Any, Callable[[], Any], bool]]) -> Callable:
+    # Only the first append can see a single output, as the outputs are a list hereafter.
+    single_output = appends[0][2]
+
+    def append(outputs):
+        # Handle flex signature.
+        if isinstance(outputs, dict):
+            for key, value, _ in appends:
+                outputs[key] = value()
+            return outputs
+        return ([outputs] if single_output else as_list(outputs)) + [value() for _, value, _ in appends]
+
+    return append
+
+
 class CallbackBlueprint:
     def __init__(self, *args, **kwargs):
         # Collect args "normally".
@@ -226,7 +470,19 @@ class CallbackBlueprint:
             )
         # Collect the rest.
         self.kwargs: Dict[str, Any] = kwargs
-        self.f: Union[Callable[..., Any], str, ClientsideFunction] | None = None
+        self._f: Union[Callable[..., Any], str, ClientsideFunction] | None = None
+        self.plan = CallPlan()
+
+    @property
+    def f(self) -> Union[Callable[..., Any], str, ClientsideFunction] | None:
+        # Pending steps of the call plan are compiled, before the function is exposed (and possibly wrapped).
+        if self.plan.steps:
+            self._f, self.plan = self.plan.compile(self._f), CallPlan()
+        return self._f
+
+    @f.setter
+    def f(self, value: Union[Callable[..., Any], str, ClientsideFunction] | None):
+        self._f = value
 
     def register(self, app: dash.Dash):  # noqa: C901
         # Collect dependencies.
@@ -251,10 +507,11 @@ class CallbackBlueprint:
 
     @property
     def uid(self) -> str:
-        if isinstance(self.f, (ClientsideFunction, str)):
-            f_repr = repr(self.f)  # handles clientside functions
-        elif self.f is not None:
-            f_repr = f"{self.f.__module__}.{self.f.__name__}"  # handles Python functions
+        # The call plan is not compiled here, as that would split it (the wrapper has the same name anyway).
+        if isinstance(self._f, (ClientsideFunction, str)):
+            f_repr = repr(self._f)  # handles clientside functions
+        elif self._f is not None:
+            f_repr = f"{self._f.__module__}.{self._f.__name__}"  # handles Python functions
         else:
             f_repr = "None"
         f_hash = hashlib.md5(f_repr.encode()).digest()
@@ -333,10 +590,27 @@ class DashBlueprint:
             callbacks += GLOBAL_BLUEPRINT.callbacks
             clientside_callbacks += GLOBAL_BLUEPRINT.clientside_callbacks
         # Proceed as before.
+        layouts = self._static_layouts()
         for transform in self.transforms:
+            transform.resolve_layout(layouts)
             callbacks, clientside_callbacks = transform.apply(callbacks, clientside_callbacks)
         return callbacks, clientside_callbacks
 
+    def _static_layouts(self) -> List[Any]:
+        """
+        This method collects the layouts that are not generated per request, incl. those of the registered pages.
+        """
+        layouts = [] if self._layout is None or self._layout_is_function else [self._layout]
+        for page in page_registry.values():
+            layout = page.get("layout")
+            # Pages registered via a blueprint serve the (transformed) layout of the blueprint.
+            blueprint = getattr(layout, "__self__", None)
+            if isinstance(blueprint, DashBlueprint):
+                layout = None if blueprint._layout_is_function else blueprint._layout
+            if layout is not None and not callable(layout):
+                layouts.append(layout)
+        return layouts
+
     # TODO: Include or not? The plugin still seems a bit immature.
     def register(
         self,
@@ -393,6 +667,15 @@ class DashProxy(dash.Dash):
     DashProxy is a wrapper around the DashBlueprint object enabling drop-in replacement of the original Dash object. It
     enables transforms (via the DashBlueprint object), performs the necessary app configuration for all transforms to
     work (e.g. setting a secret key on the server), and exposes convenience functions such as 'hijack'.
+
+    Per default, the blueprint is resolved (i.e. the transforms are applied, and the callbacks registered) on the first
+    request. To move this cost to startup, call 'compile' once all callbacks have been declared (e.g. at the end of the
+    app module, so that with gunicorn --preload, the resolved callbacks are shared by the workers). Afterwards, the
+    'callback' and 'clientside_callback' methods register callbacks directly with Dash (i.e. without transforms), as
+    after the first request. With eager=True, 'run' compiles the app before starting the server, and a warning is
+    logged if the app is not compiled before the first request. Note that WSGI servers (e.g. gunicorn) do not call
+    'run', i.e. with those, 'compile' must be called explicitly. Once resolved, the dependencies (and a static layout)
+    are served from precompressed responses.
     """
 
     def __init__(
@@ -402,6 +685,7 @@ class DashProxy(dash.Dash):
         include_global_callbacks=True,
         blueprint=None,
         prevent_initial_callbacks="initial_duplicate",
+        eager: bool = False,
         **kwargs,
     ):
         super().__init__(*args, prevent_initial_callbacks=prevent_initial_callbacks, **kwargs)
@@ -410,7 +694,10 @@ class DashProxy(dash.Dash):
             if blueprint is None
             else blueprint
         )
+        self.eager = eager
         self.setup_server_lock = threading.Lock()
+        self._resolved: Tuple[int, ...] | None = None
+        self._cached_responses: Dict[str, _CachedResponse] = {}
 
     def callback(self, *args, **kwargs):
         return self.blueprint.callback(*args, **kwargs)
@@ -430,17 +717,62 @@ class DashProxy(dash.Dash):
     def register_callbacks(self):
         self.blueprint.register_callbacks(super())
 
+    def compile(self):
+        """
+        Resolve the blueprint, i.e. apply the transforms and register the callbacks, which would otherwise happen on
+        the first request. Raises a RuntimeError, if callbacks were added to the blueprint after a previous compile.
+        """
+        with self.setup_server_lock:
+            if self._resolved is not None:
+                self._verify_resolved(raise_error=True)
+                return
+            self._compile()
+
+    def run(self, *args, **kwargs):
+        if self.eager:
+            self.compile()
+        return super().run(*args, **kwargs)
+
+    def _compile(self):
+        # Trigger callback generation for embedded layouts.
+        if self.blueprint._layout_is_function:
+            _ = self.blueprint.layout()
+        self.register_callbacks()
+        # Apply the layout transforms, unless the layout is generated per request.
+        if self.blueprint._layout is not None and not self.blueprint._layout_is_function:
+            _ = self._layout_value()
+        self._resolved = self._blueprint_size()
+        # Remap callback bindings to enable callback registration after the blueprint has been resolved.
+        self.callback = super().callback
+        self.clientside_callback = super().clientside_callback
+
+    def _verify_resolved(self, raise_error: bool):
+        size = self._blueprint_size()
+        if size == self._resolved:
+            return
+        num_callbacks = sum(size) - sum(self._resolved)  # type: ignore[arg-type]
+        message = (
+            f"{num_callbacks} callback(s) were added to the blueprint after the app was compiled, and will be ignored. "
+            "Please declare all callbacks before calling 'compile'."
+        )
+        if raise_error:
+            raise RuntimeError(message)
+        logging.error(message)
+
+    def _blueprint_size(self) -> Tuple[int, ...]:
+        blueprints = [self.blueprint] + ([GLOBAL_BLUEPRINT] if self.blueprint.include_global_callbacks else [])
+        return tuple(n for bp in blueprints for n in (len(bp.callbacks), len(bp.clientside_callbacks)))
+
     def _setup_server(self):
         with self.setup_server_lock:
             first_request = not bool(self._got_first_request["setup_server"])
             if first_request:
-                # Trigger callback generation for embedded layouts.
-                if self.blueprint._layout_is_function:
-                    _ = self.blueprint.layout()
-                self.register_callbacks()
-                # Remap callback bindings to enable callback registration via the 'before_first_request' hook.
-                self.callback = super().callback
-                self.clientside_callback = super().clientside_callback
+                if self._resolved is not None:
+                    self._verify_resolved(raise_error=False)
+                else:
+                    if self.eager:
+                        logging.warning("The app was not compiled before the first request, please call 'compile'.")
+                    self._compile()
                 # Set session secret. Used by some subclasses.
                 if not self.server.secret_key:
                     self.server.secret_key = secrets.token_urlsafe(16)
@@ -468,6 +800,26 @@ class DashProxy(dash.Dash):
     def _layout_value(self):
         return self.blueprint._layout_value()
 
+    def dependencies(self):
+        # Callbacks might still be registered after the first request, i.e. the cache is keyed on their number.
+        return self._serve_cached("dependencies", super().dependencies, len(self._callback_list))
+
+    def serve_layout(self):
+        if self.blueprint._layout_is_function:
+            return super().serve_layout()
+        return self._serve_cached("layout", super().serve_layout, self.blueprint._layout)
+
+    def _serve_cached(self, name: str, serve: Callable[[], Any], key: Any):
+        # The response is static only once the blueprint has been resolved. Other servers than Flask are not supported.
+        if self._resolved is None or not has_request_context():
+            return serve()
+        cached = self._cached_responses.get(name)
+        if cached is None or cached.key != key:
+            response = serve()
+            cached = _CachedResponse(response.get_data(), response.mimetype, key)
+            self._cached_responses[name] = cached
+        return cached.serve()
+
     @property
     def layout(self):
         return self.blueprint._layout
@@ -477,6 +829,47 @@ class DashProxy(dash.Dash):
         self.blueprint.layout = value
 
 
+class _CachedResponse:
+    """
+    Response that is compressed once (gzip, and brotli if installed), and served with a strong ETag per encoding. If
+    the client already holds the response (If-None-Match), it is answered with 304 (Not Modified).
+    """
+
+    def __init__(self, data: bytes, mimetype: str | None, key: Any = None):
+        self.mimetype = mimetype
+        self.key = key
+        self.digest = hashlib.sha256(data).hexdigest()[:32]
+        self.bodies = {"identity": data, "gzip": gzip.compress(data, mtime=0)}
+        brotli_compress = _resolve_brotli()
+        if brotli_compress is not None:
+            self.bodies["br"] = brotli_compress(data)
+
+    def serve(self) -> Response:
+        encoding = next((e for e in ["br", "gzip"] if e in self.bodies and request.accept_encodings[e]), "identity")
+        etag = self.digest if encoding == "identity" else f"{self.digest}-{encoding}"
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(self.bodies[encoding], mimetype=self.mimetype)
+            if encoding != "identity":
+                response.headers["Content-Encoding"] = encoding
+        response.set_etag(etag)
+        response.headers["Vary"] = "Accept-Encoding"
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+def _resolve_brotli() -> Callable[[bytes], bytes] | None:
+    try:
+        import brotli
+    except ImportError:
+        try:
+            import brotlicffi as brotli  # type: ignore
+        except ImportError:
+            return None
+    return brotli.compress
+
+
 def _get_session_id(session_key=None):
     session_key = "session_id" if session_key is None else session_key
     # Create unique session id.
@@ -525,6 +918,9 @@ class DashTransform:
     def transform_layout(self, layout):
         return layout  # per default, do nothing
 
+    def resolve_layout(self, layouts):
+        pass  # per default, do nothing (invoked with the static layouts, when the callbacks are resolved)
+
     def get_dependent_transforms(self):
         return []
 
@@ -673,38 +1069,40 @@ class BlockingCallbackTransform(StatefulDashTransform):
             in_flex_key = callback.inputs.append(Input(start_client_id, "data"))
             st_flex_key = callback.inputs.append(State(start_client_ctx, "data"))
             # Modify the callback function accordingly.
-            f = callback.f
-            callback.f = skip_input_signal_add_output_signal(num_outputs, out_flex_key, in_flex_key, st_flex_key)(f)
+            name = getattr(callback._f, "__name__", repr(callback._f))
+            _plan_blocking(callback.plan, num_outputs, out_flex_key, in_flex_key, st_flex_key, name)
 
         return callbacks
 
 
 def skip_input_signal_add_output_signal(num_outputs, out_flex_key, in_flex_key, st_flex_key):
     def wrapper(f):
-        @functools.wraps(f)
-        def decorated_function(*args, **kwargs):
-            args, kwargs, fltr = _skip_inputs(args, kwargs, [in_flex_key, st_flex_key])
-            cached_ctx = fltr[1]
-            single_output = num_outputs <= 1
-            if cached_ctx is not None and "triggered" in cached_ctx and context_value is not None:
-                try:
-                    local_ctx = context_value.get()
-                    local_ctx["triggered_inputs"] = cached_ctx["triggered"]
-                    context_value.set(local_ctx)
-                except (LookupError, TypeError, AttributeError, KeyError):
-                    pass
-            try:
-                outputs = f(*args, **kwargs)
-            except Exception as e:
-                if not isinstance(e, PreventUpdate):
-                    logging.exception(f"Exception raised in blocking callback [{f.__name__}]")
-                outputs = _determine_outputs(single_output)
+        plan = _plan_blocking(CallPlan(), num_outputs, out_flex_key, in_flex_key, st_flex_key, f.__name__)
+        return plan.compile(f)
+
+    return wrapper
 
-            return _append_output(outputs, datetime.now(timezone.utc).timestamp(), single_output, out_flex_key)
 
-        return decorated_function
+def _plan_blocking(plan: CallPlan, num_outputs, out_flex_key, in_flex_key, st_flex_key, name: str) -> CallPlan:
+    single_output = num_outputs <= 1
 
-    return wrapper
+    def restore_context(values):
+        cached_ctx = values[1]
+        if cached_ctx is not None and "triggered" in cached_ctx and context_value is not None:
+            try:
+                local_ctx = context_value.get()
+                local_ctx["triggered_inputs"] = cached_ctx["triggered"]
+                context_value.set(local_ctx)
+            except (LookupError, TypeError, AttributeError, KeyError):
+                pass
+
+    def fallback(e: Exception):
+        if not isinstance(e, PreventUpdate):
+            logging.exception(f"Exception raised in blocking callback [{name}]")
+        return _determine_outputs(single_output)
+
+    plan.skip_inputs([in_flex_key, st_flex_key], restore_context).guard(fallback)
+    return plan.append_output(out_flex_key, lambda: datetime.now(timezone.utc).timestamp(), single_output)
 
 
 def _determine_outputs(single_output: bool) -> Any:
@@ -768,24 +1166,22 @@ class LoadingTransform(DashTransform):
             single_output = len(callback.outputs) <= 1
             out_flex_key = callback.outputs.append(Output(self.kwargs["id"], "children", allow_duplicate=True))
             # Modify the callback function accordingly.
-            f = callback.f
-            callback.f = bind_loading(single_output, out_flex_key)(f)
+            callback.plan.append_output(out_flex_key, _no_update, single_output)
 
         return callbacks
 
 
 def bind_loading(single_output, out_flex_key):
     def wrapper(f):
-        @functools.wraps(f)
-        def decorated_function(*args, **kwargs):
-            outputs = f(*args, **kwargs)
-            return _append_output(outputs, dash.no_update, single_output, out_flex_key)
-
-        return decorated_function
+        return CallPlan().append_output(out_flex_key, _no_update, single_output).compile(f)
 
     return wrapper
 
 
+def _no_update():
+    return dash.no_update
+
+
 # endregion
 
 # region Cycle breaker transform
@@ -809,6 +1205,7 @@ class CycleBreakerTransform(StatefulDashTransform):
                     cycle_inputs[cid] = (i.component_id, i.component_property)
                     i.component_id = cid
                     i.component_property = "dst"
+            c.inputs.invalidate()
         # Construct components.
         self.components = [CycleBreaker(id=cid) for cid in cycle_inputs]
         # Construct callbacks.
@@ -893,6 +1290,8 @@ class PrefixIdTransform(DashTransform):
                 i.component_id = apply_prefix(self.prefix, i.component_id, self.escape)
             for o in callback.outputs:
                 o.component_id = apply_prefix(self.prefix, o.component_id, self.escape)
+            callback.inputs.invalidate()
+            callback.outputs.invalidate()
         return callbacks
 
     def apply_serverside(self, callbacks):
@@ -990,8 +1389,7 @@ class TriggerTransform(DashTransform):
             if not any(is_trigger):
                 continue
             # If so, filter the callback args.
-            f = callback.f
-            callback.f = filter_args(is_trigger)(f)
+            callback.plan.skip_inputs([i for i, trigger in enumerate(is_trigger) if trigger])
         return callbacks
 
     def apply_clientside(self, callbacks):
@@ -1015,14 +1413,7 @@ return func({", ".join(filtered_args)});
 
 def filter_args(args_filter):
     def wrapper(f):
-        @functools.wraps(f)
-        def decorated_function(*args):
-            post_args = list(args[len(args_filter) :])
-            args = list(args[: len(args_filter)])
-            filtered_args = [arg for j, arg in enumerate(args) if not args_filter[j]] + post_args
-            return f(*filtered_args)
-
-        return decorated_function
+        return CallPlan().skip_inputs([j for j, skip in enumerate(args_filter) if skip]).compile(f)
 
     return wrapper
 
@@ -1089,53 +1480,75 @@ def extract_non_optional(annotation):
 class SerializationTransform(DashTransform):
     def apply_serverside(self, callbacks):
         for callback in callbacks:
-            f = callback.f
-            callback.f = self._unpack_pack_callback(callback)(f)
+            self._plan_callback(callback)
         return callbacks
 
     def _try_load(self, data: Any, ann=None):
         raise NotImplementedError
 
+    def _resolve_loader(self, ann) -> Callable[[Any], Any] | None:
+        """
+        Resolve the loader of arguments annotated by ann, or None if such arguments are passed on as is. Per default,
+        all arguments are loaded via _try_load.
+        """
+        return functools.partial(self._try_load, ann=ann)
+
     def _try_dump(self, obj: Any):
         raise NotImplementedError
 
-    def _unpack_pack_callback(self, callback):  # noqa: C901
-        full_arg_spec = inspect.getfullargspec(callback.f)
-
-        def unpack_pack_args(f):
-            @functools.wraps(f)
-            def decorated_function(*args, **kwargs):
-                args = list(args)
-                # Replace args and kwargs. # TODO: Is recursion needed?
-                for i, arg in enumerate(args):
-                    an = full_arg_spec.annotations.get(full_arg_spec.args[i])
-                    value = [self._try_load(a, an) for a in arg] if isinstance(arg, list) else self._try_load(arg, an)
-                    args[i] = value
-                for key in kwargs:
-                    arg = kwargs[key]
-                    an = full_arg_spec.annotations.get(key)
-                    value = [self._try_load(a, an) for a in arg] if isinstance(arg, list) else self._try_load(arg, an)
-                    kwargs[key] = value
-                # Evaluate function.
-                data = f(*args, **kwargs)
-                # Capture outputs.
-                data = self._try_dump(data)
-                if isinstance(data, list):
-                    data = [self._try_dump(element) for element in data]
-                if isinstance(data, tuple):
-                    data = tuple([self._try_dump(element) for element in data])
-                if isinstance(data, dict):
-                    data = {key: self._try_dump(data[key]) for key in data}
-                return data
-
-            return decorated_function
+    def _plan_callback(self, callback, prepare_outputs=None):
+        load_args = self._args_loader(callback)
+        if load_args is not None:
+            callback.plan.map_args(load_args)
+        if prepare_outputs is not None:
+            callback.plan.map_outputs(prepare_outputs)
+        callback.plan.map_outputs(self._dump_outputs)
+
+    def _args_loader(self, callback) -> Callable[[List[Any], Dict[str, Any]], None] | None:
+        # The (pending) steps of other serialization transforms keep the arguments, i.e. the names of callback._f apply.
+        full_arg_spec = inspect.getfullargspec(callback._f)
+        # Resolve the loader of each parameter once, i.e. arguments without a loader are skipped on each call.
+        names = full_arg_spec.args + full_arg_spec.kwonlyargs
+        loaders = {name: self._resolve_loader(full_arg_spec.annotations.get(name)) for name in names}
+        default = self._resolve_loader(None)  # for arguments that are not in the signature (e.g. *args, **kwargs)
+        positional = [(i, loaders[name]) for i, name in enumerate(full_arg_spec.args) if loaders[name] is not None]
+        num_positional = len(full_arg_spec.args)
+        if not positional and default is None and not any(loaders.values()):
+            return None
 
-        return unpack_pack_args
+        def load_args(args, kwargs):
+            for i, loader in positional:
+                if i < len(args):
+                    args[i] = _load_arg(loader, args[i])
+            if default is not None:
+                for i in range(num_positional, len(args)):
+                    args[i] = _load_arg(default, args[i])
+            for key in kwargs:
+                loader = loaders.get(key, default)
+                if loader is not None:
+                    kwargs[key] = _load_arg(loader, kwargs[key])
+
+        return load_args
+
+    def _dump_outputs(self, data):
+        data = self._try_dump(data)
+        if isinstance(data, list):
+            data = [self._try_dump(element) for element in data]
+        if isinstance(data, tuple):
+            data = tuple([self._try_dump(element) for element in data])
+        if isinstance(data, dict):
+            data = {key: self._try_dump(data[key]) for key in data}
+        return data
 
     def sort_key(self):
         return 0
 
 
+def _load_arg(loader: Callable[[Any], Any], arg: Any) -> Any:
+    # List elements (e.g. of pattern matching inputs) are loaded one by one.
+    return [loader(element) for element in arg] if isinstance(arg, list) else loader(arg)
+
+
 # endregion
 
 # region DataclassTransform
@@ -1143,9 +1556,17 @@ class SerializationTransform(DashTransform):
 
 class DataclassTransform(SerializationTransform):
     def _try_load(self, data: Any, ann=None) -> Any:
+        loader = self._resolve_loader(ann)
+        return data if loader is None else loader(data)
+
+    def _resolve_loader(self, ann) -> Callable[[Any], Any] | None:
         ann = extract_non_optional(ann)
         if not dataclasses.is_dataclass(ann):
-            return data
+            return None
+        return functools.partial(self._load, ann)
+
+    @staticmethod
+    def _load(ann, data: Any) -> Any:
         if data is None:
             return None
         if isinstance(data, str):
@@ -1168,9 +1589,17 @@ class DataclassTransform(SerializationTransform):
 
 class BaseModelTransform(SerializationTransform):
     def _try_load(self, data: Any, ann=None) -> Any:
+        loader = self._resolve_loader(ann)
+        return data if loader is None else loader(data)
+
+    def _resolve_loader(self, ann) -> Callable[[Any], Any] | None:
         ann = extract_non_optional(ann)
         if not isinstance(ann, type(BaseModel)):
-            return data
+            return None
+        return functools.partial(self._load, ann)
+
+    @staticmethod
+    def _load(ann, data: Any) -> Any:
         if data is None:
             return None
         if isinstance(data, str):
@@ -1200,6 +1629,31 @@ class ServersideBackend:
     def has(self, key):
         raise NotImplementedError()
 
+    def delete(self, key):
+        raise NotImplementedError()
+
+    def get_many(self, *keys, ignore_expired=False) -> List[Any]:
+        """
+        Get multiple values at once. Per default, the keys are fetched one at a time.
+        """
+        return [self.get(key, ignore_expired=ignore_expired) for key in keys]
+
+    def set_many(self, mapping: Dict[str, Any]) -> List[str]:
+        """
+        Set multiple values at once. Returns the keys that were set. Per default, the keys are set one at a time.
+        """
+        return [key for key, value in mapping.items() if self.set(key, value)]
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        """
+        Try to acquire a lock that is shared by all processes using the backend. Returns True if the lock was acquired.
+        Locks that are not released within timeout seconds are considered stale, and can be acquired again.
+        """
+        raise NotImplementedError()
+
+    def release_lock(self, key: str):
+        raise NotImplementedError()
+
     @property
     def uid(self) -> str:
         """
@@ -1208,30 +1662,363 @@ class ServersideBackend:
         return self.__class__.__name__
 
 
+def _is_partial_read(e: BaseException) -> bool:
+    # Decoders report truncated input in different ways, e.g. pickle ("pickle data was truncated"), zlib ("incomplete
+    # or truncated stream") and lzma (EOFError, wrapped in a SerializerError).
+    while e is not None:
+        if isinstance(e, (OSError, EOFError, struct.error)) or "truncated" in str(e):
+            return True
+        e = e.__cause__
+    return False
+
+
 class FileSystemBackend(FileSystemCache, ServersideBackend):
-    def __init__(self, cache_dir="file_system_backend", **kwargs):
+    """
+    Store that uses the file system as backend. Per default, the number of files is limited by the (inline) threshold
+    pruning of flask_caching. Alternatively, the size of the cache can be limited to max_bytes. In this case, entries
+    are evicted according to the eviction policy (lru, lfu, or ttl) by the compact method, which is invoked by a
+    background thread every compact_interval seconds (if set). Entries accessed within the last min_idle seconds are
+    never evicted, as they are likely still in use by live sessions, even if they have expired. For large caches, set
+    shard_depth > 0 to spread the files across (two hex character) prefix directories, thereby keeping per-directory
+    file counts low. Existing caches can be converted to a new layout via the migrate method. Per default, values are
+    pickled with out-of-band buffers (PickleBufferSerializer), i.e. large arrays are not copied in memory on write.
+
+    The backend can be shared by multiple worker processes. Values are written to a temporary file, which is then
+    atomically renamed, i.e. readers never see a partially written file, and concurrent writers of the same key are
+    serialized by advisory file locks (on POSIX). Reads that fail on truncated data are retried (read_retries) with
+    exponential backoff, starting at read_retry_delay seconds, before the entry is considered missing. Corrupt entries
+    are considered missing at once.
+    """
+
+    eviction_policies = ["lru", "lfu", "ttl"]
+    # Directory (within the cache directory) holding the lock files of the writers.
+    _fs_lock_dir = "__dex_locks"
+
+    def __init__(
+        self,
+        cache_dir="file_system_backend",
+        serializer: BaseSerializer | None = None,
+        max_workers: int = 8,
+        max_bytes: int | None = None,
+        eviction_policy: str = "lru",
+        min_idle: float = 60,
+        compact_interval: float | None = None,
+        shard_depth: int = 0,
+        read_retries: int = 3,
+        read_retry_delay: float = 0.01,
+        **kwargs,
+    ):
+        if eviction_policy not in self.eviction_policies:
+            raise ValueError(f"Unsupported eviction policy [{eviction_policy}], use one of {self.eviction_policies}.")
+        self.serializer = PickleBufferSerializer() if serializer is None else serializer
+        self.shard_depth = shard_depth
+        self._shard_dirs: set[str] = set()
+        self.read_retries = read_retries
+        self.read_retry_delay = read_retry_delay
+        # When a quota is set, eviction is handled by compaction rather than inline threshold pruning.
+        if max_bytes is not None:
+            kwargs.setdefault("threshold", 0)
         super().__init__(cache_dir, **kwargs)
+        # Thread pool used for parallel reads/writes of multiple files.
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # Setup quota and eviction.
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self.min_idle = min_idle
+        self._access_counts: Dict[str, int] = defaultdict(int)
+        # Owner tokens of the locks held by this process, i.e. only the owner releases a lock.
+        self._lock_tokens: Dict[str, str] = {}
+        self._janitor_stop = threading.Event()
+        if compact_interval is not None:
+            janitor = threading.Thread(
+                target=self._janitor, args=(compact_interval,), daemon=True, name="serverside_janitor"
+            )
+            janitor.start()
+
+    def set(self, key, value, timeout=None, mgmt_element=False):
+        # Management elements have no timeout, and don't trigger pruning (to avoid loops).
+        if mgmt_element:
+            timeout = 0
+        else:
+            self._prune()
+        filename = self._get_filename(key)
+        if self.shard_depth:
+            self._ensure_shard_dir(filename)
+        with self._write_lock(filename):
+            overwrite = os.path.isfile(filename)
+            try:
+                self._replace_file(filename, value, self._normalize_timeout(timeout))
+                size = os.stat(filename).st_size
+            except OSError:
+                logging.warning("Exception raised while handling cache file '%s'", filename, exc_info=True)
+                return False
+        # Management elements don't count towards the threshold.
+        if not overwrite and not mgmt_element:
+            self._update_count(delta=1)
+        return size > 0
+
+    def _replace_file(self, filename: str, value: Any, expires: int):
+        tmp = None
+        try:
+            # The temporary file is created next to the target, so that the rename is atomic.
+            fd, tmp = tempfile.mkstemp(suffix=self._fs_transaction_suffix, dir=os.path.dirname(filename))
+            with os.fdopen(fd, "wb") as f:
+                f.write(struct.pack("I", expires))
+                self.serializer.dump(value, f)
+            self._run_safely(os.chmod, tmp, self._mode)
+            self._run_safely(os.replace, tmp, filename)
+            if os.path.exists(tmp):
+                raise OSError(f"Unable to replace cache file '{filename}'.")
+            tmp = None
+        finally:
+            if tmp is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp)
 
     def get(self, key: str, ignore_expired=False):
         if key is None:
             return None
-        if not ignore_expired:
-            return super().get(key)
-        # TODO: This part must be implemented for each type of cache.
+        value = self._read(key, ignore_expired)
+        if value is not None and self.max_bytes is not None:
+            self._record_access(self._get_filename(key))
+        return value
+
+    def _read(self, key: str, ignore_expired: bool):
+        filename = self._get_filename(key)
+        for attempt in range(self.read_retries + 1):
+            if attempt > 0:
+                time.sleep(self.read_retry_delay * 2 ** (attempt - 1))
+            try:
+                with self._safe_stream_open(filename, "rb") as f:
+                    expires = struct.unpack("I", f.read(4))[0]
+                    if not ignore_expired and expires != 0 and expires < time.time():
+                        return None
+                    return self.serializer.load(f)
+            except FileNotFoundError:
+                return None
+            except (OSError, EOFError, struct.error, pickle.UnpicklingError, SerializerError) as e:
+                # The file might have been replaced, or written by a non-atomic writer, while reading. Try again,
+                # unless the data could be read in full, i.e. the entry is corrupt.
+                if attempt == self.read_retries or not _is_partial_read(e):
+                    logging.warning("Exception raised while handling cache file '%s'", filename, exc_info=True)
+                    return None
+        return None
+
+    @contextlib.contextmanager
+    def _write_lock(self, filename: str):
+        try:
+            import fcntl
+        except ImportError:
+            # No advisory locks (e.g. on Windows), but the writes are still atomic.
+            yield
+            return
+        # Lock files are striped by the (hashed) file name to keep their number bounded.
+        lock_dir = os.path.join(self._path, self._fs_lock_dir)
+        os.makedirs(lock_dir, exist_ok=True)
+        # The lock file is opened per write, as locks held via a shared descriptor (e.g. after fork) don't exclude.
+        with open(os.path.join(lock_dir, os.path.basename(filename)[:2]), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _is_mgmt(self, name: str) -> bool:
+        return name == self._fs_lock_dir or super()._is_mgmt(name)
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        # The lock is an (ordinary) cache entry holding an owner token. It is created atomically (O_EXCL), and stale
+        # locks are taken over by an atomic replace. The check and the takeover are serialized by the advisory write
+        # lock, i.e. only one process can take over a stale lock. Without advisory locks, the last writer wins.
+        filename = self._get_filename(key)
+        if self.shard_depth:
+            self._ensure_shard_dir(filename)
+        token = secrets.token_hex(16)
+        expires = int(time.time() + timeout)
+        with self._write_lock(filename):
+            try:
+                fd = os.open(filename, os.O_CREAT | os.O_EXCL | os.O_WRONLY, self._mode)
+            except FileExistsError:
+                try:
+                    if self._read_expiry(filename) > time.time():
+                        return False
+                    self._replace_file(filename, token, expires)
+                except (OSError, struct.error):
+                    # The lock is being written (or released) by a process without advisory locks.
+                    return False
+                if self._read(key, ignore_expired=True) != token:
+                    return False
+            else:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(struct.pack("I", expires))
+                    self.serializer.dump(token, f)
+        self._lock_tokens[key] = token
+        return True
+
+    def release_lock(self, key: str):
+        # Locks that have been taken over (as they went stale) are owned by another process, i.e. they are kept.
+        token = self._lock_tokens.pop(key, None)
         filename = self._get_filename(key)
+        with self._write_lock(filename):
+            if token is None or self._read(key, ignore_expired=True) != token:
+                return
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(filename)
+
+    def compact(self) -> int:
+        """
+        Evict entries according to the eviction policy until the cache fits within max_bytes. Returns the number of
+        bytes freed.
+        """
+        if self.max_bytes is None:
+            return 0
+        now = time.time()
+        entries, total = [], 0
+        for filename in self._list_dir():
+            try:
+                stat = os.stat(filename)
+                expires = self._read_expiry(filename) if self.eviction_policy == "ttl" else 0
+            except FileNotFoundError:
+                continue
+            except (OSError, struct.error):
+                logging.warning("Exception raised while handling cache file '%s'", filename, exc_info=True)
+                continue
+            total += stat.st_size
+            entries.append((filename, stat.st_size, stat.st_mtime, expires))
+        # Forget access counts of entries that no longer exist.
+        existing = {os.path.basename(entry[0]) for entry in entries}
+        for name in list(self._access_counts):
+            if name not in existing:
+                self._access_counts.pop(name, None)
+        if total <= self.max_bytes:
+            return 0
+        # Evict entries that have not been accessed recently.
+        candidates = sorted([e for e in entries if now - e[2] >= self.min_idle], key=self._eviction_key)
+        freed = 0
+        for filename, size, _, _ in candidates:
+            if total - freed <= self.max_bytes:
+                break
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                continue
+            except OSError:
+                logging.warning("Exception raised while handling cache file '%s'", filename, exc_info=True)
+                continue
+            self._access_counts.pop(os.path.basename(filename), None)
+            self._update_count(delta=-1)
+            freed += size
+        return freed
+
+    def close(self):
+        """
+        Stop the background compaction thread (if any).
+        """
+        self._janitor_stop.set()
+
+    def migrate(self) -> int:
+        """
+        Move existing cache files (e.g. from a flat layout) into the layout given by shard_depth. Returns the number
+        of files moved.
+        """
+        moved = 0
+        lock_dir = os.path.join(self._path, self._fs_lock_dir)
+        for root, dirs, files in os.walk(self._path, topdown=False):
+            if root == lock_dir:
+                continue
+            for name in files:
+                if name.endswith(self._fs_transaction_suffix):
+                    continue
+                source, target = os.path.join(root, name), self._sharded_filename(name)
+                if source == target:
+                    continue
+                self._ensure_shard_dir(target)
+                os.replace(source, target)
+                moved += 1
+            # Remove shard directories that are no longer needed.
+            if root != self._path and not os.listdir(root):
+                os.rmdir(root)
+                self._shard_dirs.discard(root)
+        return moved
+
+    def _get_filename(self, key):
+        filename = super()._get_filename(key)
+        if not self.shard_depth:
+            return filename
+        return self._sharded_filename(os.path.basename(filename))
+
+    def _sharded_filename(self, name: str) -> str:
+        shards = [name[2 * i : 2 * i + 2] for i in range(self.shard_depth)]
+        return os.path.join(self._path, *shards, name)
+
+    def _ensure_shard_dir(self, filename: str):
+        directory = os.path.dirname(filename)
+        if directory not in self._shard_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._shard_dirs.add(directory)
+
+    def _list_dir(self):
+        if not self.shard_depth:
+            return super()._list_dir()
+        return self._walk_shards(self._path, self.shard_depth)
+
+    def _walk_shards(self, path: str, depth: int):
         try:
-            with self._safe_stream_open(filename, "rb") as f:
-                _ = struct.unpack("I", f.read(4))[0]
-                return self.serializer.load(f)
+            entries = list(os.scandir(path))
         except FileNotFoundError:
+            return
+        for entry in entries:
+            if depth == 0:
+                if entry.is_file() and not self._is_mgmt(entry.name):
+                    yield entry.path
+            elif entry.is_dir() and len(entry.name) == 2:
+                yield from self._walk_shards(entry.path, depth - 1)
+
+    def _janitor(self, interval: float):
+        while not self._janitor_stop.wait(interval):
+            try:
+                self.compact()
+            except Exception:
+                logging.exception(f"Exception raised while compacting cache [{self._path}]")
+
+    def _eviction_key(self, entry):
+        filename, _, last_access, expires = entry
+        if self.eviction_policy == "lfu":
+            return self._access_counts.get(os.path.basename(filename), 0), last_access
+        if self.eviction_policy == "ttl":
+            return expires if expires != 0 else float("inf"), last_access
+        return last_access
+
+    def _read_expiry(self, filename: str) -> int:
+        with self._safe_stream_open(filename, "rb") as f:
+            return struct.unpack("I", f.read(4))[0]
+
+    def _record_access(self, filename: str):
+        # The modification time is used as access time, as atime is often disabled (noatime/relatime).
+        self._access_counts[os.path.basename(filename)] += 1
+        try:
+            os.utime(filename)
+        except OSError:
             pass
-        except (OSError, EOFError, struct.error):
-            logging.warning(
-                "Exception raised while handling cache file '%s'",
-                filename,
-                exc_info=True,
-            )
-        return None
+
+    def get_many(self, *keys, ignore_expired=False):
+        if len(keys) < 2:
+            return [self.get(key, ignore_expired=ignore_expired) for key in keys]
+        return list(self._get_executor().map(functools.partial(self.get, ignore_expired=ignore_expired), keys))
+
+    def set_many(self, mapping, timeout=None):
+        if len(mapping) < 2:
+            return [key for key, value in mapping.items() if self.set(key, value, timeout)]
+        results = self._get_executor().map(lambda item: self.set(item[0], item[1], timeout), mapping.items())
+        return [key for key, result in zip(mapping, results) if result]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="serverside_io")
+            return self._executor
 
     @property
     def uid(self) -> str:
@@ -1247,72 +2034,1451 @@ class RedisBackend(RedisCache, ServersideBackend):
     during a user session. If it does, the user experience for those sessions will be degraded.
     """
 
-    def __init__(self, default_timeout=24 * 3600, **kwargs):
+    # Deletes the lock only if it is still held by the owner (token), i.e. it has not been taken over.
+    _release_script = 'if redis.call("get", KEYS[1]) == ARGV[1] then return redis.call("del", KEYS[1]) end return 0'
+
+    def __init__(self, default_timeout=24 * 3600, serializer: BaseSerializer | None = None, **kwargs):
+        if serializer is not None:
+            self.serializer = serializer
         super().__init__(default_timeout=default_timeout, **kwargs)
+        self._lock_tokens: Dict[str, str] = {}
 
     def get(self, key, ignore_expired=False):
         # TODO: Is there any way to honor ignore_expired for redis? I don't think so
         return super().get(key)
 
+    def get_many(self, *keys, ignore_expired=False):
+        # Fetches all keys in a single round trip (MGET). Writes are pipelined by set_many.
+        return super().get_many(*keys)
 
-class EnrichedOutput(Output):
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        name = f"{self._get_prefix()}{key}"
+        token = secrets.token_hex(16)
+        if not self._write_client.set(name=name, value=token, nx=True, ex=timeout):
+            return False
+        self._lock_tokens[key] = token
+        return True
+
+    def release_lock(self, key: str):
+        # Locks that have expired (and possibly been acquired by another process) are kept.
+        token = self._lock_tokens.pop(key, None)
+        if token is not None:
+            self._write_client.eval(self._release_script, 1, f"{self._get_prefix()}{key}", token)
+
+
+class SQLiteBackend(ServersideBackend):
     """
-    Like a normal Output, includes additional properties related to storing the data.
+    Store that uses a SQLite database (in WAL mode) as backend. It is well suited for single host deployments with
+    multiple worker processes, as reads are concurrent, writes are atomic, and lookups are indexed. As for the
+    FileSystemBackend, expired entries can still be read (ignore_expired=True) until they are removed by evict.
     """
 
     def __init__(
         self,
-        component_id,
-        component_property,
-        allow_duplicate=False,
-        backend=None,
-        session_check=None,
-        arg_check=True,
+        path: str = "serverside.sqlite",
+        default_timeout: int = 24 * 3600,
+        serializer: BaseSerializer | None = None,
+        timeout: float = 30,
     ):
-        super().__init__(component_id, component_property, allow_duplicate)
-        self.backend = backend
-        self.session_check = session_check
-        self.arg_check = arg_check
+        self.path = path
+        self.default_timeout = default_timeout
+        self.serializer = PickleBufferSerializer() if serializer is None else serializer
+        self._connect_timeout = timeout
+        self._local = threading.local()
+        self._connections: weakref.WeakSet[_ThreadConnection] = weakref.WeakSet()
+        self._lock_tokens: Dict[str, str] = {}
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS serverside "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL, created REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS serverside_expires ON serverside (expires)")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS serverside_locks "
+                "(key TEXT PRIMARY KEY, expires REAL NOT NULL, token TEXT NOT NULL)"
+            )
 
+    def get(self, key, ignore_expired=False):
+        if key is None:
+            return None
+        row = self._connection().execute("SELECT value, expires FROM serverside WHERE key = ?", (key,)).fetchone()
+        if row is None or (not ignore_expired and self._is_expired(row[1])):
+            return None
+        return self.serializer.loads(row[0])
 
-class ServersideOutputTransform(SerializationTransform):
-    prefix: str = "SERVERSIDE_"
+    def set(self, key, value, timeout=None):
+        row = (key, self.serializer.dumps(value), self._expires(timeout), time.time())
+        with self._connection() as connection:
+            connection.execute("INSERT OR REPLACE INTO serverside VALUES (?, ?, ?, ?)", row)
+        return True
 
-    def __init__(
-        self,
-        backends: Optional[List[ServersideBackend]] = None,
-        default_backend: Optional[ServersideBackend] = None,
-    ):
-        super().__init__()
-        # Per default, use file system backend.
-        if backends is None:
-            backends = [FileSystemBackend()]
-        self._default_backend: ServersideBackend = backends[0] if default_backend is None else default_backend
-        # Setup registry for easy/fast access.
-        self._backend_registry: Dict[str, ServersideBackend] = {backend.uid: backend for backend in backends}
+    def has(self, key):
+        query = "SELECT 1 FROM serverside WHERE key = ? AND (expires = 0 OR expires >= ?)"
+        return self._connection().execute(query, (key, time.time())).fetchone() is not None
+
+    def delete(self, key):
+        with self._connection() as connection:
+            connection.execute("DELETE FROM serverside WHERE key = ?", (key,))
+        return True
+
+    def get_many(self, *keys, ignore_expired=False):
+        rows = {}
+        # Stay below the SQLite limit on the number of query parameters.
+        for i in range(0, len(keys), 500):
+            chunk = [key for key in keys[i : i + 500] if key is not None]
+            query = f"SELECT key, value, expires FROM serverside WHERE key IN ({', '.join(['?'] * len(chunk))})"
+            rows.update({row[0]: row[1:] for row in self._connection().execute(query, chunk)})
+        values = []
+        for key in keys:
+            row = rows.get(key)
+            if row is None or (not ignore_expired and self._is_expired(row[1])):
+                values.append(None)
+                continue
+            values.append(self.serializer.loads(row[0]))
+        return values
+
+    def set_many(self, mapping, timeout=None):
+        now, expires = time.time(), self._expires(timeout)
+        rows = [(key, self.serializer.dumps(value), expires, now) for key, value in mapping.items()]
+        with self._connection() as connection:
+            connection.executemany("INSERT OR REPLACE INTO serverside VALUES (?, ?, ?, ?)", rows)
+        return list(mapping)
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        now, token = time.time(), secrets.token_hex(16)
+        # Writes are serialized by SQLite, i.e. only one process can insert the lock.
+        with self._connection() as connection:
+            connection.execute("DELETE FROM serverside_locks WHERE key = ? AND expires < ?", (key, now))
+            query = "INSERT OR IGNORE INTO serverside_locks VALUES (?, ?, ?)"
+            if connection.execute(query, (key, now + timeout, token)).rowcount != 1:
+                return False
+        self._lock_tokens[key] = token
+        return True
+
+    def release_lock(self, key: str):
+        # Locks that have been taken over (as they went stale) are owned by another process, i.e. they are kept.
+        token = self._lock_tokens.pop(key, None)
+        if token is None:
+            return
+        with self._connection() as connection:
+            connection.execute("DELETE FROM serverside_locks WHERE key = ? AND token = ?", (key, token))
 
-    def _try_load(self, data: Any, ann=None) -> Any:
-        if not isinstance(data, str):
-            return data
-        if not data.startswith(self.prefix):
-            return data
-        obj = json.loads(data[len(self.prefix) :])
-        backend = self._backend_registry[obj["backend_uid"]]
-        value = backend.get(obj["key"], ignore_expired=True)
+    def evict(self, max_bytes: int | None = None) -> int:
+        """
+        Remove expired entries, and (if max_bytes is set) the oldest entries until the total size of the values fits
+        within max_bytes. Returns the number of entries removed.
+        """
+        with self._connection() as connection:
+            query = "DELETE FROM serverside WHERE expires != 0 AND expires < ?"
+            removed = connection.execute(query, (time.time(),)).rowcount
+            if max_bytes is None:
+                return removed
+            # Keep the newest entries, which fit within the budget.
+            query = (
+                "DELETE FROM serverside WHERE key IN (SELECT key FROM (SELECT key, SUM(LENGTH(value)) "
+                "OVER (ORDER BY created DESC, key) AS total FROM serverside) WHERE total > ?)"
+            )
+            return removed + connection.execute(query, (max_bytes,)).rowcount
+
+    def vacuum(self):
+        """
+        Reclaim the space of removed entries, and truncate the write-ahead log.
+        """
+        connection = self._connection()
+        connection.execute("VACUUM")
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    @property
+    def uid(self) -> str:
+        """
+        Backend identifier. Must be unique across the backend registry.
+        """
+        return f"{self.__class__.__name__}:{self.path}"
+
+    def close(self):
+        """
+        Close the connections of all threads. Connections are reopened on use.
+        """
+        for connection in list(self._connections):
+            connection.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        # Connections are per thread, and must not be shared with forked processes (e.g. gunicorn --preload). They are
+        # closed when the thread exits, i.e. when the thread local is finalized.
+        local = getattr(self._local, "connection", None)
+        if local is None or local.closed or local.pid != os.getpid():
+            # The connection is only used by this thread, but it might be closed by another (see close).
+            connection = sqlite3.connect(self.path, timeout=self._connect_timeout, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            local = self._local.connection = _ThreadConnection(connection)
+            self._connections.add(local)
+        return local.connection
+
+    def _expires(self, timeout: int | None) -> float:
+        timeout = self.default_timeout if timeout is None else timeout
+        return 0 if timeout == 0 else time.time() + timeout
+
+    @staticmethod
+    def _is_expired(expires: float) -> bool:
+        return expires != 0 and expires < time.time()
+
+
+class _ThreadConnection:
+    """
+    SQLite connection of a thread, which is closed when the thread local holding it is finalized.
+    """
+
+    __slots__ = ("connection", "pid", "closed", "__weakref__")
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.pid = os.getpid()
+        self.closed = False
+
+    def close(self):
+        # Connections inherited from the parent process (after fork) are left to the parent.
+        if self.closed or self.pid != os.getpid():
+            return
+        self.closed = True
+        with contextlib.suppress(sqlite3.Error):
+            self.connection.close()
+
+    def __del__(self):
+        self.close()
+
+
+class SharedMemoryBackend(ServersideBackend):
+    """
+    Store that keeps values in named shared memory segments, which any worker process on the host can attach to. The
+    segments are tracked in a small SQLite index (key to segment name). Numpy arrays and pyarrow tables are returned as
+    read-only, zero-copy views of the segment; other values are stored using the serializer, and copied on read.
+
+    Segments are reference counted by the operating system. When an entry expires, evict removes it from the index and
+    unlinks the segment, but the memory is only released when the last process holding a view has closed it. A
+    process closes the segment of a key when it attaches a newer one, and (at most every release_interval seconds)
+    releases the segments that are no longer indexed, e.g. after other workers overwrote or evicted them.
+    """
+
+    def __init__(
+        self,
+        index_path: str = "serverside_shm.sqlite",
+        default_timeout: int = 24 * 3600,
+        serializer: BaseSerializer | None = None,
+        prefix: str = "dex",
+        release_interval: float = 60,
+    ):
+        self.index = SQLiteBackend(index_path, default_timeout=default_timeout)
+        self.default_timeout = default_timeout
+        self.serializer = PickleBufferSerializer() if serializer is None else serializer
+        self.prefix = prefix
+        self.release_interval = release_interval
+        self._segments: Dict[str, Any] = {}
+        self._names: Dict[str, str] = {}
+        self._released = time.monotonic()
+        self._lock = threading.Lock()
+
+    def get(self, key, ignore_expired=False):
+        self._release_periodically()
+        descriptor = self.index.get(key, ignore_expired=ignore_expired)
+        if descriptor is None:
+            return None
+        try:
+            segment = self._attach(descriptor["name"], key)
+        except FileNotFoundError:
+            # The segment was evicted by another process.
+            return None
+        return self._decode(segment, descriptor)
+
+    def set(self, key, value, timeout=None):
+        self._release_periodically()
+        segment, descriptor = self._encode(value)
+        try:
+            previous = self.index.get(key, ignore_expired=True)
+            self.index.set(key, descriptor, timeout=timeout)
+        except BaseException:
+            # The segment is not indexed, i.e. no other process can find (and unlink) it.
+            self._unlink(segment.name)
+            raise
+        if previous is not None:
+            self._unlink(previous["name"])
+        self._attach(segment.name, key)
+        return True
+
+    def has(self, key):
+        return self.index.has(key)
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        return self.index.acquire_lock(key, timeout)
+
+    def release_lock(self, key: str):
+        self.index.release_lock(key)
+
+    def delete(self, key):
+        descriptor = self.index.get(key, ignore_expired=True)
+        self.index.delete(key)
+        if descriptor is not None:
+            self._unlink(descriptor["name"])
+        return True
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """
+        Remove expired entries, and (if max_bytes is set) the oldest entries until the total size of the segments fits
+        within max_bytes. The segments are unlinked. Returns the number of entries removed.
+        """
+        connection = self.index._connection()
+        rows = connection.execute("SELECT key, value, expires FROM serverside ORDER BY created DESC, key").fetchall()
+        total, evicted = 0, []
+        for key, value, expires in rows:
+            descriptor = self.index.serializer.loads(value)
+            if not SQLiteBackend._is_expired(expires):
+                total += descriptor["size"]
+                if max_bytes is None or total <= max_bytes:
+                    continue
+            evicted.append((key, descriptor["name"]))
+        with connection:
+            connection.executemany("DELETE FROM serverside WHERE key = ?", [(key,) for key, _ in evicted])
+        for _, name in evicted:
+            self._unlink(name)
+        self.release()
+        return len(evicted)
+
+    def release(self):
+        """
+        Close the segments attached by this process that are no longer indexed. Segments, which are still referenced by
+        views handed out to callbacks, are kept open until the next call.
+        """
+        with self._lock:
+            names = list(self._segments)
+        if not names:
+            return
+        query = "SELECT value FROM serverside"
+        indexed = {self.index.serializer.loads(row[0])["name"] for row in self.index._connection().execute(query)}
+        for name in names:
+            if name not in indexed:
+                self._close(name)
+        with self._lock:
+            self._names = {key: name for key, name in self._names.items() if name in self._segments}
+
+    def close(self):
+        """
+        Close all segments attached by this process. The segments themselves are not removed.
+        """
+        with self._lock:
+            names = list(self._segments)
+        for name in names:
+            self._close(name)
+
+    @property
+    def uid(self) -> str:
+        """
+        Backend identifier. Must be unique across the backend registry.
+        """
+        return f"{self.__class__.__name__}:{self.index.path}"
+
+    def _encode(self, value: Any) -> Tuple[Any, dict]:
+        module = type(value).__module__.split(".")[0]
+        if module == "numpy" and hasattr(value, "dtype") and hasattr(value, "shape") and not value.dtype.hasobject:
+            import numpy
+
+            value = numpy.ascontiguousarray(value)
+            segment = self._create(value.nbytes)
+            numpy.ndarray(value.shape, dtype=value.dtype, buffer=segment.buf)[...] = value
+            dtype = value.dtype.descr if value.dtype.names else value.dtype.str
+            meta = dict(kind="numpy", dtype=dtype, shape=value.shape, size=value.nbytes)
+            return segment, dict(name=segment.name, **meta)
+        if module == "pyarrow" and type(value).__name__ == "Table":
+            import pyarrow
+
+            sink = pyarrow.BufferOutputStream()
+            with pyarrow.ipc.new_file(sink, value.schema) as writer:
+                writer.write_table(value)
+            data = sink.getvalue()
+            kind = "arrow"
+        else:
+            data = self.serializer.dumps(value)
+            kind = "serializer"
+        segment = self._create(len(data))
+        segment.buf[: len(data)] = memoryview(data).cast("B")
+        return segment, dict(name=segment.name, kind=kind, size=len(data))
+
+    def _decode(self, segment: Any, descriptor: dict) -> Any:
+        buffer = segment.buf[: descriptor["size"]]
+        if descriptor["kind"] == "numpy":
+            import numpy
+
+            dtype = numpy.dtype(descriptor["dtype"])
+            array = numpy.ndarray(descriptor["shape"], dtype=dtype, buffer=buffer)
+            array.flags.writeable = False
+            return array
+        if descriptor["kind"] == "arrow":
+            import pyarrow
+
+            return pyarrow.ipc.open_file(pyarrow.py_buffer(buffer)).read_all()
+        return self.serializer.loads(bytes(buffer))
+
+    def _create(self, size: int) -> Any:
+        name = f"{self.prefix}_{secrets.token_hex(8)}"
+        # Segments must have a non-zero size, also for empty values.
+        segment = _open_shared_memory(name, create=True, size=max(size, 1))
+        with self._lock:
+            self._segments[name] = segment
+        return segment
+
+    def _attach(self, name: str, key: str | None = None) -> Any:
+        with self._lock:
+            segment = self._segments.get(name)
+            if segment is None:
+                segment = self._segments[name] = _open_shared_memory(name)
+            previous = None if key is None else self._names.get(key)
+            if key is not None:
+                self._names[key] = name
+        # The index points to a newer segment, i.e. the previous one of the key is no longer needed by this process.
+        if previous is not None and previous != name:
+            self._close(previous)
+        return segment
+
+    def _release_periodically(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._released < self.release_interval:
+                return
+            self._released = now
+        self.release()
+
+    def _unlink(self, name: str):
+        try:
+            _unlink_shared_memory(self._attach(name))
+        except FileNotFoundError:
+            pass
+        self._close(name)
+
+    def _close(self, name: str):
+        with self._lock:
+            segment = self._segments.get(name)
+            if segment is None:
+                return
+            try:
+                segment.close()
+            except BufferError:
+                # Views of the segment are still alive, try again on the next release.
+                return
+            del self._segments[name]
+
+
+def _open_shared_memory(name: str, create: bool = False, size: int = 0) -> Any:
+    from multiprocessing import resource_tracker, shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, create=create, size=size, track=False)
+    # Before Python 3.13, the resource tracker unlinks the segment when the process that opened it exits, which would
+    # pull it away from the other workers. The lifetime is managed by the index instead.
+    segment = shared_memory.SharedMemory(name, create=create, size=size)
+    if os.name == "posix":
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _unlink_shared_memory(segment: Any):
+    from multiprocessing import resource_tracker
+
+    # Before Python 3.13, unlink also unregisters the segment from the resource tracker (see _open_shared_memory).
+    if sys.version_info < (3, 13) and os.name == "posix":
+        resource_tracker.register(segment._name, "shared_memory")
+    segment.unlink()
+
+
+class SerializerError(ValueError):
+    """
+    Raised by the serializers, when data cannot be decoded (e.g. a truncated or partially written file).
+    """
+
+
+class PickleBufferSerializer(BaseSerializer):
+    """
+    Serializer that uses pickle protocol 5 with out-of-band buffers, i.e. the data of (contiguous) numpy arrays, data
+    frames, etc. is written straight to the file rather than being copied into the pickle first. On load, the buffers
+    are read into place (readinto), or, with mmap=True, memory mapped (note that numpy arrays are then read-only). Other
+    payloads (e.g. existing entries) are handled by the fallback serializer, or unpickled directly if none is given.
+    Unlike the BaseSerializer, errors (e.g. truncated data) are raised rather than logged.
+    """
+
+    magic = b"DEXPICKLE5"
+
+    def __init__(self, fallback: BaseSerializer | None = None, mmap: bool = False):
+        self.fallback = fallback
+        self.mmap = mmap
+
+    def dump(self, value, f, *args, **kwargs):
+        buffers: List[pickle.PickleBuffer] = []
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        # Without out-of-band buffers, it's an ordinary pickle.
+        if not buffers:
+            f.write(data)
+            return
+        raws = [buffer.raw() for buffer in buffers]
+        # Pad the buffers, so that they are (64 byte) aligned relative to the file.
+        position = f.tell() + len(self.magic) + 12 + 10 * len(raws) + len(data)
+        header = [self.magic, struct.pack("<QI", len(data), len(raws))]
+        paddings = []
+        for raw in raws:
+            paddings.append(-position % 64)
+            header.append(struct.pack("<QH", raw.nbytes, paddings[-1]))
+            position += paddings[-1] + raw.nbytes
+        f.write(b"".join(header))
+        f.write(data)
+        for raw, padding in zip(raws, paddings):
+            f.write(bytes(padding))
+            f.write(raw)
+
+    def load(self, f):
+        start = f.tell()
+        if f.read(len(self.magic)) != self.magic:
+            f.seek(start)
+            return pickle.load(f) if self.fallback is None else self.fallback.load(f)
+        size, count = struct.unpack("<QI", f.read(12))
+        layout = [struct.unpack("<QH", f.read(10)) for _ in range(count)]
+        data = f.read(size)
+        mapped = None
+        if self.mmap and count:
+            try:
+                mapped = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                pass
+        buffers = []
+        for nbytes, padding in layout:
+            offset = f.seek(padding, io.SEEK_CUR)
+            if mapped is not None:
+                buffers.append(mapped[offset : offset + nbytes])
+                f.seek(nbytes, io.SEEK_CUR)
+                continue
+            buffer = bytearray(nbytes)
+            view, read = memoryview(buffer), 0
+            while read < nbytes:
+                n = f.readinto(view[read:])
+                if not n:
+                    raise EOFError("Unexpected end of file while reading pickle buffer.")
+                read += n
+            buffers.append(buffer)
+        return pickle.loads(data, buffers=buffers)
+
+    def dumps(self, value, *args, **kwargs):
+        f = io.BytesIO()
+        self.dump(value, f)
+        return f.getvalue()
+
+    def loads(self, bvalue):
+        if bvalue is None or not bvalue.startswith(self.magic):
+            return pickle.loads(bvalue) if self.fallback is None else self.fallback.loads(bvalue)
+        return self.load(io.BytesIO(bvalue))
+
+
+class ArrowSerializer(BaseSerializer):
+    """
+    Serializer that stores data frames (pandas, polars, pyarrow) and numpy arrays in the Arrow IPC (Feather) format.
+    When loading from a file, the data is memory mapped, i.e. the Arrow buffers are not copied, and only the pages that
+    are touched are read from disk. This makes loading of Arrow tables and numpy arrays zero-copy; note that numpy
+    arrays are loaded as read-only views. Pandas data frames are copied when converted to Arrow on dump and back to
+    pandas on load (to keep them writable), i.e. only the disk read is saved for them. All other values are handled
+    by the fallback serializer, which should match the default serializer of the backend (e.g. RedisSerializer for the
+    RedisBackend) if the backend holds existing data.
+    """
+
+    magic = b"DEXARROW"
+
+    def __init__(self, fallback: BaseSerializer | None = None):
+        try:
+            import pyarrow
+            import pyarrow.ipc  # noqa: F401
+        except ImportError as e:
+            raise ImportError("The ArrowSerializer requires pyarrow, please install it (pip install pyarrow).") from e
+        self._pa = pyarrow
+        self.fallback = PickleBufferSerializer() if fallback is None else fallback
+
+    def dump(self, value, f, *args, **kwargs):
+        kind, data = self._encode(value)
+        if kind is None:
+            return self.fallback.dump(value, f, *args, **kwargs)
+        self._write(kind, data, f)
+
+    def load(self, f):
+        start = f.tell()
+        header = f.read(len(self.magic) + 2)
+        if not header.startswith(self.magic):
+            f.seek(start)
+            return self.fallback.load(f)
+        offset = start + len(header) + header[-1]
+        try:
+            # Memory map the file, thereby avoiding copying the data.
+            buffer = self._pa.py_buffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).slice(offset)
+        except (AttributeError, OSError, ValueError):
+            f.seek(offset)
+            buffer = self._pa.py_buffer(f.read())
+        return self._decode(header[-2:-1], buffer)
+
+    def dumps(self, value, *args, **kwargs):
+        kind, data = self._encode(value)
+        if kind is None:
+            return self.fallback.dumps(value, *args, **kwargs)
+        f = io.BytesIO()
+        self._write(kind, data, f)
+        return f.getvalue()
+
+    def loads(self, bvalue):
+        if bvalue is None or not bvalue.startswith(self.magic):
+            return self.fallback.loads(bvalue)
+        header_size = len(self.magic) + 2
+        buffer = self._pa.py_buffer(bvalue).slice(header_size + bvalue[header_size - 1])
+        return self._decode(bvalue[header_size - 2 : header_size - 1], buffer)
+
+    def _encode(self, value):
+        pa = self._pa
+        module, name = type(value).__module__.split(".")[0], type(value).__name__
+        try:
+            if module == "pandas" and name == "DataFrame":
+                # Mixed type column names do not survive the round trip.
+                if len({type(c) for c in value.columns}) <= 1:
+                    return b"p", pa.Table.from_pandas(value)
+            if module == "polars" and name == "DataFrame":
+                return b"l", value.to_arrow()
+            if module == "pyarrow" and isinstance(value, pa.Table):
+                return b"t", value
+            if module == "numpy" and name == "ndarray":
+                return b"n", pa.Tensor.from_numpy(value)
+        except (pa.ArrowException, TypeError, ValueError):
+            pass  # e.g. object columns of mixed type
+        return None, None
+
+    def _decode(self, kind, buffer):
+        pa = self._pa
+        try:
+            if kind == b"n":
+                return pa.ipc.read_tensor(pa.BufferReader(buffer)).to_numpy()
+            table = pa.ipc.open_file(buffer).read_all()
+        except pa.ArrowException as e:
+            raise SerializerError("Unable to decode Arrow data.") from e
+        if kind == b"p":
+            # Copies the data; zero-copy conversion (split_blocks, self_destruct) would yield read-only data frames.
+            return table.to_pandas()
+        if kind == b"l":
+            import polars
+
+            return polars.from_arrow(table)
+        return table
+
+    def _write(self, kind, data, f):
+        pa = self._pa
+        # Pad the header so that the Arrow buffers are (64 byte) aligned relative to the file.
+        header = self.magic + kind
+        padding = -(f.tell() + len(header) + 1) % 64
+        f.write(header + bytes([padding]) + bytes(padding))
+        sink = pa.PythonFile(f, mode="w")
+        if kind == b"n":
+            pa.ipc.write_tensor(data, sink)
+            return
+        with pa.ipc.new_file(sink, data.schema) as writer:
+            writer.write_table(data)
+
+
+class CompressedSerializer(BaseSerializer):
+    """
+    Serializer that compresses the output of another serializer, if it exceeds a size threshold. Compressed entries
+    are marked by a header, i.e. compressed and uncompressed entries can coexist. Supported codecs are zlib and lzma
+    (standard library), zstd (standard library from Python 3.14, otherwise requires zstandard), and lz4 (requires lz4).
+    Statistics on compression ratio and timing are available via the stats property.
+    """
+
+    magic = b"DEXZ"
+    codecs = ["zlib", "lzma", "zstd", "lz4"]
+
+    def __init__(self, serializer: BaseSerializer | None = None, codec: str = "zlib", threshold: int = 64 * 1024):
+        if codec not in self.codecs:
+            raise ValueError(f"Unsupported codec [{codec}], please use one of {self.codecs}.")
+        self.serializer = PickleBufferSerializer() if serializer is None else serializer
+        self.codec = codec
+        self.threshold = threshold
+        self._compress, _ = _resolve_codec(codec)
+        self._decompressors: Dict[str, Callable[[bytes], bytes]] = {}
+        self._lock = threading.Lock()
+        self._stats = dict(
+            compressed=0,
+            uncompressed=0,
+            raw_bytes=0,
+            compressed_bytes=0,
+            compress_time=0.0,
+            decompress_time=0.0,
+        )
+
+    def dump(self, value, f, *args, **kwargs):
+        f.write(self.dumps(value, *args, **kwargs))
+
+    def load(self, f):
+        start = f.tell()
+        if f.read(len(self.magic)) != self.magic:
+            f.seek(start)
+            return self.serializer.load(f)
+        return self._decompress(f.read())
+
+    def dumps(self, value, *args, **kwargs):
+        data = self.serializer.dumps(value, *args, **kwargs)
+        if data is None or len(data) < self.threshold:
+            self._count(uncompressed=1)
+            return data
+        tic = time.perf_counter()
+        compressed = self._compress(data)
+        elapsed = time.perf_counter() - tic
+        self._count(compressed=1, raw_bytes=len(data), compressed_bytes=len(compressed), compress_time=elapsed)
+        return self.magic + bytes([self.codecs.index(self.codec)]) + compressed
+
+    def loads(self, bvalue):
+        if bvalue is None or not bvalue.startswith(self.magic):
+            return self.serializer.loads(bvalue)
+        return self._decompress(bvalue[len(self.magic) :])
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["ratio"] = stats["raw_bytes"] / stats["compressed_bytes"] if stats["compressed_bytes"] else 1.0
+        return stats
+
+    def _decompress(self, data: bytes):
+        # The codec is read from the header, i.e. entries written with another codec can still be loaded.
+        if not data or data[0] >= len(self.codecs):
+            raise SerializerError("Invalid compression header.")
+        codec = self.codecs[data[0]]
+        if codec not in self._decompressors:
+            _, self._decompressors[codec] = _resolve_codec(codec)
+        tic = time.perf_counter()
+        try:
+            raw = self._decompressors[codec](data[1:])
+        except Exception as e:  # the codecs raise their own error types
+            raise SerializerError(f"Unable to decompress {codec} data.") from e
+        self._count(decompress_time=time.perf_counter() - tic)
+        return self.serializer.loads(raw)
+
+    def _count(self, **kwargs):
+        with self._lock:
+            for key, value in kwargs.items():
+                self._stats[key] += value
+
+
+def _resolve_codec(codec: str) -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    if codec == "zlib":
+        return zlib.compress, zlib.decompress
+    if codec == "lzma":
+        return lzma.compress, lzma.decompress
+    if codec == "zstd":
+        try:
+            from compression import zstd  # type: ignore  # Python 3.14+
+
+            return zstd.compress, zstd.decompress
+        except ImportError:
+            pass
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("The zstd codec requires zstandard, please install it (pip install zstandard).") from e
+        return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+    try:
+        import lz4.frame
+    except ImportError as e:
+        raise ImportError("The lz4 codec requires lz4, please install it (pip install lz4).") from e
+    return lz4.frame.compress, lz4.frame.decompress
+
+
+class TieredBackend(ServersideBackend):
+    """
+    Backend that keeps recently used values in an in-memory LRU cache (bounded by a byte budget) in front of another,
+    slower, backend. Writes go through to the wrapped backend, i.e. values remain available to other workers. Note
+    that values served from memory are shared, i.e. in-place modifications of a loaded value affect later reads.
+
+    Values written via the tier expire from memory along with the wrapped backend. The expiry of values loaded from the
+    wrapped backend is unknown, so they are only served from memory if expired values are accepted (ignore_expired).
+    """
+
+    def __init__(
+        self,
+        backend: ServersideBackend,
+        max_bytes: int = 256 * 1024**2,
+        size_func: Callable[[Any], int] | None = None,
+    ):
+        self.backend = backend
+        self.max_bytes = max_bytes
+        self.size_func = _estimate_size if size_func is None else size_func
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[Any, int, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, ignore_expired=False):
+        if key is None:
+            return None
+        found, value = self._lookup(key, ignore_expired)
+        if found:
+            return value
+        value = self.backend.get(key, ignore_expired=ignore_expired)
+        if value is not None:
+            self._put(key, value)
+        return value
+
+    def set(self, key, value, timeout=None):
+        result = self.backend.set(key, value) if timeout is None else self.backend.set(key, value, timeout=timeout)
+        self._put(key, value, self._expires(timeout))
+        return result
+
+    def has(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() < entry[2]:
+                return True
+        return self.backend.has(key)
+
+    def get_many(self, *keys, ignore_expired=False):
+        values: List[Any] = [None] * len(keys)
+        missing = []
+        for i, key in enumerate(keys):
+            if key is None:
+                continue
+            found, values[i] = self._lookup(key, ignore_expired)
+            if not found:
+                missing.append(i)
+        if not missing:
+            return values
+        loaded = self.backend.get_many(*[keys[i] for i in missing], ignore_expired=ignore_expired)
+        for i, value in zip(missing, loaded):
+            values[i] = value
+            if value is not None:
+                self._put(keys[i], value)
+        return values
+
+    def set_many(self, mapping, timeout=None):
+        result = self.backend.set_many(mapping) if timeout is None else self.backend.set_many(mapping, timeout=timeout)
+        expires = self._expires(timeout)
+        for key, value in mapping.items():
+            self._put(key, value, expires)
+        return result
+
+    def delete(self, key):
+        with self._lock:
+            self._discard(key)
+        return self.backend.delete(key)
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        return self.backend.acquire_lock(key, timeout)
+
+    def release_lock(self, key: str):
+        self.backend.release_lock(key)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    @property
+    def uid(self) -> str:
+        """
+        Backend identifier. Delegates to the wrapped backend, so that references are valid with or without the tier.
+        """
+        return self.backend.uid
+
+    @property
+    def default_timeout(self) -> int:
+        return getattr(self.backend, "default_timeout", 0)
+
+    def _lookup(self, key, ignore_expired) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not (ignore_expired or time.time() < entry[2]):
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[0]
+
+    def _expires(self, timeout) -> float:
+        # Same semantics as the wrapped backends, i.e. None means the default timeout, and 0 means no expiry.
+        timeout = self.default_timeout if timeout is None else timeout
+        return float("inf") if not timeout else time.time() + timeout
+
+    def _put(self, key, value, expires: float = 0):
+        size = self.size_func(value)
+        with self._lock:
+            self._discard(key)
+            # Values that exceed the budget are never kept in memory.
+            if size > self.max_bytes:
+                return
+            while self._entries and self._bytes + size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+            self._entries[key] = (value, size, expires)
+            self._bytes += size
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+class WriteBehindBackend(ServersideBackend):
+    """
+    Backend that persists values to another backend asynchronously, i.e. the callback does not wait for the write to
+    complete. Until a value has been persisted, it is held in an in-memory staging map, from which reads within the
+    same worker are served. Pending writes can be awaited via the flush method.
+    """
+
+    def __init__(self, backend: ServersideBackend, max_workers: int = 4):
+        self.backend = backend
+        self._staged: Dict[str, Tuple[Any, int | None]] = {}
+        self._lock = threading.Lock()
+        # Writes to the same key are serialized to ensure that the latest value wins.
+        self._key_locks = [threading.Lock() for _ in range(64)]
+        self._futures: set[Future] = set()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="serverside_write_behind")
+
+    def get(self, key, ignore_expired=False):
+        with self._lock:
+            if key in self._staged:
+                return self._staged[key][0]
+        return self.backend.get(key, ignore_expired=ignore_expired)
+
+    def set(self, key, value, timeout=None):
+        with self._lock:
+            self._staged[key] = (value, timeout)
+            future = self._executor.submit(self._persist, key)
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+        return True
+
+    def has(self, key):
+        with self._lock:
+            if key in self._staged:
+                return True
+        return self.backend.has(key)
+
+    def get_many(self, *keys, ignore_expired=False):
+        with self._lock:
+            staged = {key: self._staged[key][0] for key in keys if key in self._staged}
+        remaining = [key for key in keys if key not in staged]
+        loaded = dict(zip(remaining, self.backend.get_many(*remaining, ignore_expired=ignore_expired)))
+        return [staged[key] if key in staged else loaded[key] for key in keys]
+
+    def delete(self, key):
+        # Pending writes of the key are skipped, as the value is no longer staged.
+        with self._key_locks[hash(key) % len(self._key_locks)]:
+            with self._lock:
+                self._staged.pop(key, None)
+            return self.backend.delete(key)
+
+    def acquire_lock(self, key: str, timeout: int) -> bool:
+        return self.backend.acquire_lock(key, timeout)
+
+    def release_lock(self, key: str):
+        self.backend.release_lock(key)
+
+    def flush(self, timeout: float | None = None):
+        """
+        Wait for all pending writes to complete.
+        """
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._staged)
+
+    @property
+    def uid(self) -> str:
+        """
+        Backend identifier. Delegates to the wrapped backend, so that references are valid with or without staging.
+        """
+        return self.backend.uid
+
+    @property
+    def default_timeout(self) -> int:
+        return getattr(self.backend, "default_timeout", 0)
+
+    def _persist(self, key):
+        with self._key_locks[hash(key) % len(self._key_locks)]:
+            with self._lock:
+                if key not in self._staged:
+                    return  # already persisted by a later write
+                staged = self._staged[key]
+            value, timeout = staged
+            try:
+                if timeout is None:
+                    self.backend.set(key, value)
+                else:
+                    self.backend.set(key, value, timeout=timeout)
+            except Exception:
+                logging.exception(f"Exception raised while persisting serverside value [{key}]")
+            with self._lock:
+                if self._staged.get(key) is staged:
+                    del self._staged[key]
+
+    def _discard_future(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+
+def _estimate_size(value: Any) -> int:
+    # Fast paths for the (typically large) data containers, i.e. pandas, polars, and numpy objects.
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        except TypeError:
+            pass
+    estimated_size = getattr(value, "estimated_size", None)
+    if callable(estimated_size):
+        return int(estimated_size())
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    # Fallback to the size of the pickled value.
+    try:
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class EnrichedOutput(Output):
+    """
+    Like a normal Output, includes additional properties related to storing the data.
+    """
+
+    def __init__(
+        self,
+        component_id,
+        component_property,
+        allow_duplicate=False,
+        backend=None,
+        session_check=None,
+        arg_check=True,
+    ):
+        super().__init__(component_id, component_property, allow_duplicate)
+        self.backend = backend
+        self.session_check = session_check
+        self.arg_check = arg_check
+
+
+class ServersideOutputTransform(SerializationTransform):
+    prefix: str = "SERVERSIDE_"
+    quota_policies = ["evict", "reject"]
+    # Number of (reused) output keys tracked per process, i.e. keys whose values are deleted when superseded.
+    max_output_keys: int = 100000
+
+    def __init__(
+        self,
+        backends: Optional[List[ServersideBackend]] = None,
+        default_backend: Optional[ServersideBackend] = None,
+        content_hash: bool = False,
+        lazy: bool = False,
+        spill_threshold: int | None = None,
+        spill_targets: List[Tuple[type, str]] | None = None,
+        reuse_keys: bool = False,
+        session_quota: int | None = None,
+        quota_policy: str = "evict",
+        max_segments: int = 16,
+    ):
+        super().__init__()
+        # Per default, use file system backend.
+        if backends is None:
+            backends = [FileSystemBackend()]
+        self._default_backend: ServersideBackend = backends[0] if default_backend is None else default_backend
+        # Setup registry for easy/fast access.
+        self._backend_registry: Dict[str, ServersideBackend] = {backend.uid: backend for backend in backends}
+        # If true, values without an explicit key are stored under a hash of their content.
+        self.content_hash = content_hash
+        # If true, callbacks receive proxies that load on first use. Can be overridden per callback (lazy=True/False).
+        self.lazy = lazy
+        # If set, outputs above this size (in bytes, as JSON) are stored server side, if the target is reference safe,
+        # i.e. the value is only consumed by (server side) callbacks. Per default, that's the data of dcc.Store (in a
+        # static layout).
+        self.spill_threshold = spill_threshold
+        self.spill_targets = [(dcc.Store, "data")] if spill_targets is None else spill_targets
+        self.spills: Dict[str, int] = defaultdict(int)
+        self._reference_safe: set[Tuple[str, str]] = set()
+        self._clientside_inputs: List[Tuple[ComponentId, str]] = []
+        # If true, values are stored under a key derived from the session and the output (rather than a random key),
+        # i.e. each write replaces the previous value. Can be overridden per callback (reuse_keys=True/False). Note that
+        # browser tabs of the same session share the keys, i.e. a tab may receive a reference to a value that another
+        # tab has already replaced (and deleted). Hence, reuse keys only for apps that are used in a single tab.
+        self.reuse_keys = reuse_keys
+        self._output_keys: OrderedDict[str, bool] = OrderedDict()
+        # If set, the (estimated) bytes stored per session are limited. When exceeded, the oldest values of the session
+        # are evicted, or the write is rejected. The usage is tracked in the default backend, i.e. across processes.
+        if quota_policy not in self.quota_policies:
+            raise ValueError(f"Unsupported quota policy [{quota_policy}], use one of {self.quota_policies}.")
+        self.session_quota = session_quota
+        self.quota_policy = quota_policy
+        # Values written by ServersideAppend are compacted into a single segment, when they exceed max_segments.
+        self.max_segments = max_segments
+        self._lock = threading.Lock()
+        # In-process locks per lock key, and the number of threads using them (see _locked).
+        self._key_locks: Dict[str, List[Any]] = {}
+
+    def apply_clientside(self, callbacks):
+        # Values read by clientside callbacks must not be replaced by references.
+        for callback in callbacks:
+            self._clientside_inputs.extend([(dep.component_id, dep.component_property) for dep in callback.inputs])
+        return callbacks
+
+    def resolve_layout(self, layouts):
+        # Reference safety is derived from the static layouts, i.e. it doesn't depend on the layouts served (by the
+        # process). Targets that only appear in layout functions are never spilled.
+        if self.spill_threshold is None:
+            return
+        roots = [root for layout in layouts for root in (layout if isinstance(layout, list) else [layout])]
+        for root in roots:
+            if not hasattr(root, "_traverse"):
+                continue
+            for component in [root, *root._traverse()]:
+                component_id = getattr(component, "id", None)
+                if component_id is None:
+                    continue
+                for component_type, component_property in self.spill_targets:
+                    if isinstance(component, component_type):
+                        self._reference_safe.add((_component_id_key(component_id), component_property))
+
+    def _plan_callback(self, callback, prepare_outputs=None):
+        reuse_keys = callback.kwargs.get("reuse_keys", self.reuse_keys)
+        if self.spill_threshold is None and not reuse_keys:
+            return super()._plan_callback(callback, prepare_outputs)
+        # Snapshot the outputs, as transforms applied later might append outputs of their own.
+        structure = callback.outputs.structure
+        scalar = isinstance(structure, list) and len(structure) == 1
+        outputs = [(multi_index, callback.outputs.get(multi_index)) for multi_index in callback.outputs._index]
+        name = getattr(callback._f, "__qualname__", repr(callback._f))
+
+        def prepare_output(value: Any, output: Output) -> Any:
+            if self.spill_threshold is not None:
+                value = self._spill(value, output, name)
+            if reuse_keys:
+                value = self._reuse_key(value, output)
+            return value
+
+        def prepare_outputs(data: Any) -> Any:
+            return _map_outputs(data, scalar, outputs, prepare_output)
+
+        return super()._plan_callback(callback, prepare_outputs)
+
+    def _args_loader(self, callback) -> Callable[[List[Any], Dict[str, Any]], None] | None:
+        # Any argument might hold a reference (regardless of its annotation), but only references are resolved.
+        # Memoized callbacks get lazy values, i.e. they are hashed by reference, and only loaded on a cache miss.
+        lazy = callback.kwargs.get("lazy", self.lazy) or _is_memoized(callback)
+        load_many = self._try_load_lazy if lazy else self._try_load_many
+        full_arg_spec = inspect.getfullargspec(callback._f)
+        # Annotations by position and by name.
+        annotations = dict(enumerate(full_arg_spec.annotations.get(name) for name in full_arg_spec.args))
+        annotations.update(full_arg_spec.annotations)
+        prefix = self.prefix
+
+        def load_args(args, kwargs):
+            # Collect the references (incl. list elements) to resolve them in one batch.
+            targets, target_annotations = [], []
+            for container, keys in ((args, range(len(args))), (kwargs, list(kwargs))):
+                for key in keys:
+                    arg = container[key]
+                    if isinstance(arg, str) and arg.startswith(prefix):
+                        targets.append((container, key))
+                        target_annotations.append(annotations.get(key))
+                    elif isinstance(arg, list):
+                        indices = [j for j, e in enumerate(arg) if isinstance(e, str) and e.startswith(prefix)]
+                        if not indices:
+                            continue
+                        container[key] = arg = list(arg)
+                        targets.extend((arg, j) for j in indices)
+                        target_annotations.extend([annotations.get(key)] * len(indices))
+            if not targets:
+                return
+            loaded = load_many([container[key] for container, key in targets], target_annotations)
+            for (container, key), value in zip(targets, loaded):
+                container[key] = value
+
+        return load_args
+
+    def _spill(self, value: Any, output: Output, name: str) -> Any:
+        if value is None or value is no_update or isinstance(value, (Serverside, ServersideProxy)):
+            return value
+        if self._parse_reference(value) is not None or not self._is_reference_safe(output):
+            return value
+        try:
+            size = len(json.dumps(value, cls=plotly.utils.PlotlyJSONEncoder))
+        except (TypeError, ValueError):
+            return value
+        if size <= self.spill_threshold:
+            return value
+        key = f"{name} -> {output}"
+        if key not in self.spills:
+            logging.warning("Output of callback %s (%d bytes) was stored server side, use Serverside(...)", key, size)
+        self.spills[key] += 1
+        return Serverside(value)
+
+    def _reuse_key(self, value: Any, output: Output) -> Any:
+        if value is no_update or _is_wildcard(output.component_id):
+            return value
+        key = self._output_key(output)
+        if isinstance(value, ServersideProxy):
+            # Untouched values are references (possibly to the output key itself), touched values are dumped.
+            if not value._loaded:
+                return value
+            value = Serverside(value._value, backend=self._parse_reference(value._reference)["backend_uid"])
+        reference = self._parse_reference(value)
+        if reference is not None and reference["key"] == key:
+            return value
+        if isinstance(value, Serverside) and value.random_key:
+            content_hash = self.content_hash if value.content_hash is None else value.content_hash
+            if isinstance(value, ServersideAppend):
+                value = self._try_dump(ServersideAppend(value.value, key, value.backend_uid))
+                self._track_output_key(key, segmented=True)
+                return value
+            if not content_hash:
+                # Overwrite the previous value of the output in place. The version changes the reference on each write,
+                # so that the new value is not mistaken for the previous one (e.g. by memoized callbacks).
+                reference = self._parse_reference(self._try_dump(Serverside(value.value, key, value.backend_uid)))
+                self._track_output_key(key, segmented=False)
+                reference["version"] = uuid.uuid4().hex
+                return f"{self.prefix}{json.dumps(reference)}"
+        # The previous value of the output (if any) is superseded. Content addressed values are never deleted, as they
+        # might be referenced by other outputs. Only keys written by this process are known, i.e. values written by
+        # other processes are left to expire (or to be evicted by the session quota).
+        with self._lock:
+            segmented = self._output_keys.pop(key, None)
+        if segmented is None:
+            return value
+        for backend in self._backend_registry.values():
+            self._delete(backend, key, segmented)
+        if self.session_quota is not None:
+            self._charge(None, key, None, False)
+        return value
+
+    def _track_output_key(self, key: str, segmented: bool):
+        with self._lock:
+            self._output_keys[key] = segmented
+            self._output_keys.move_to_end(key)
+            if len(self._output_keys) > self.max_output_keys:
+                self._output_keys.popitem(last=False)
+
+    def session_usage(self, session_id: str | None = None) -> Dict[str, Any]:
+        """
+        Returns the (estimated) bytes stored by a session, and its entries (key, backend uid, bytes) from oldest to
+        newest. Defaults to the current session.
+        """
+        session_id = _get_session_id() if session_id is None else session_id
+        ledger = self._default_backend.get(self._ledger_key(session_id), ignore_expired=True) or {}
+        entries = [(key, backend_uid, size) for key, (backend_uid, size, *_) in ledger.items()]
+        return dict(bytes=sum(entry[2] for entry in entries), entries=entries)
+
+    def _charge(self, backend_uid: str | None, key: str, value: Any, shared: bool, append: bool = False):
+        # The ledger of the session is an (insertion ordered) dict of key -> (backend uid, bytes, shared, segmented).
+        session_id = _get_session_id()
+        ledger_key = self._ledger_key(session_id)
+        with self._locked(self._default_backend, f"{ledger_key}.lock"):
+            ledger = self._default_backend.get(ledger_key, ignore_expired=True) or {}
+            # Writes to an existing key (e.g. with reuse_keys) replace the previous charge. Appends add to it, i.e. a
+            # manifest and its segments are charged (and evicted) as one unit.
+            previous = ledger.pop(key, None)
+            if backend_uid is not None:
+                size = _estimate_size(value)
+                if append and previous is not None:
+                    size += previous[1]
+                total = sum(entry[1] for entry in ledger.values()) + size
+                if total > self.session_quota and (self.quota_policy == "reject" or size > self.session_quota):
+                    raise ValueError(f"Serverside quota of session [{session_id}] exceeded ({total} bytes).")
+                # Evict the oldest values of the session. Content addressed values might be used by other sessions,
+                # i.e. they are not deleted.
+                for old_key in list(ledger):
+                    if total <= self.session_quota:
+                        break
+                    old_backend_uid, old_size, old_shared, old_segmented = ledger.pop(old_key)
+                    if not old_shared and old_backend_uid in self._backend_registry:
+                        self._delete(self._backend_registry[old_backend_uid], old_key, old_segmented)
+                    total -= old_size
+                ledger[key] = (backend_uid, size, shared, append)
+            self._default_backend.set(ledger_key, ledger)
+
+    @staticmethod
+    def _delete(backend: ServersideBackend, key: str, segmented: bool):
+        # Values written by ServersideAppend are deleted along with their segments.
+        if segmented:
+            manifest = backend.get(key, ignore_expired=True)
+            if isinstance(manifest, _SegmentManifest):
+                for segment in manifest.segments:
+                    backend.delete(segment)
+        backend.delete(key)
+
+    @contextlib.contextmanager
+    def _locked(self, backend: ServersideBackend, lock_key: str, timeout: int = 10):
+        # Serialize updates of the key within the process, and (if the backend supports it) across processes. Locks
+        # held longer than the timeout are stale, i.e. failing to acquire the lock within the timeout is an error.
+        deadline = time.monotonic() + timeout
+        with self._key_lock(lock_key, timeout):
+            acquired = False
+            try:
+                while not (acquired := backend.acquire_lock(lock_key, timeout)):
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Unable to acquire lock [{lock_key}] within {timeout} seconds.")
+                    time.sleep(0.01)
+            except NotImplementedError:
+                pass
+            try:
+                yield
+            finally:
+                if acquired:
+                    backend.release_lock(lock_key)
+
+    @contextlib.contextmanager
+    def _key_lock(self, lock_key: str, timeout: int):
+        # The lock of a key is dropped, when no thread is using it.
+        with self._lock:
+            entry = self._key_locks.setdefault(lock_key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            if not entry[0].acquire(timeout=timeout):
+                raise TimeoutError(f"Unable to acquire lock [{lock_key}] within {timeout} seconds.")
+            try:
+                yield
+            finally:
+                entry[0].release()
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[lock_key]
+
+    def _ledger_key(self, session_id: str) -> str:
+        return f"{self.prefix}USAGE_{session_id}"
+
+    def _output_key(self, output: Output) -> str:
+        output_id = f"{_component_id_key(output.component_id)}.{output.component_property}"
+        return f"{_get_session_id()}_{hashlib.sha256(output_id.encode()).hexdigest()[:32]}"
+
+    def _is_reference_safe(self, output: Output) -> bool:
+        component_id = output.component_id
+        # Wildcard outputs are never spilled.
+        if _is_wildcard(component_id):
+            return False
+        if (_component_id_key(component_id), output.component_property) not in self._reference_safe:
+            return False
+        for input_id, input_property in self._clientside_inputs:
+            if input_property == output.component_property and _component_id_matches(input_id, component_id):
+                return False
+        return True
+
+    def _try_load(self, data: Any, ann=None) -> Any:
+        obj = self._parse_reference(data)
+        if obj is None:
+            return data
+        backend = self._backend_registry[obj["backend_uid"]]
+        value = backend.get(obj["key"], ignore_expired=True)
+        if isinstance(value, _SegmentManifest):
+            return self._load_segments(backend, value)
         return value
 
+    def _try_load_many(self, values: List[Any], annotations: List[Any]) -> List[Any]:
+        # Group the references by backend, and fetch them in one batch per backend.
+        batches = defaultdict(list)
+        for i, data in enumerate(values):
+            obj = self._parse_reference(data)
+            if obj is not None:
+                batches[obj["backend_uid"]].append((i, obj["key"]))
+        values = list(values)
+        for backend_uid, batch in batches.items():
+            backend = self._backend_registry[backend_uid]
+            loaded = backend.get_many(*[key for _, key in batch], ignore_expired=True)
+            for (i, _), value in zip(batch, loaded):
+                values[i] = self._load_segments(backend, value) if isinstance(value, _SegmentManifest) else value
+        return values
+
+    def _load_segments(self, backend: ServersideBackend, manifest: _SegmentManifest) -> Any:
+        segments = backend.get_many(*manifest.segments, ignore_expired=True)
+        # If any segment is missing (e.g. expired), so is the value.
+        if any(segment is None for segment in segments):
+            return None
+        return segments[0] if len(segments) == 1 else _concat(segments)
+
+    def _append(self, backend: ServersideBackend, backend_uid: str, obj: ServersideAppend) -> str:
+        if obj.random_key:
+            raise ValueError("ServersideAppend requires a key (or reuse_keys).")
+        _concat_kind(obj.value)
+        # Only the delta is written, as a new segment.
+        segment_key = f"{obj.key}_{uuid.uuid4().hex}"
+        if self.session_quota is not None and has_request_context():
+            self._charge(backend_uid, obj.key, obj.value, False, append=True)
+        backend.set(segment_key, obj.value)
+        obsolete = []
+        with self._locked(backend, f"{obj.key}.lock"):
+            manifest = backend.get(obj.key, ignore_expired=True)
+            if not isinstance(manifest, _SegmentManifest):
+                segments = []
+                # An existing (plain) value becomes the base segment.
+                if manifest is not None:
+                    segments.append(f"{obj.key}_{uuid.uuid4().hex}")
+                    backend.set(segments[0], manifest)
+                manifest = _SegmentManifest(segments)
+            manifest.segments.append(segment_key)
+            manifest.version += 1
+            # Compact the segments into a new base segment. The charge of the value (i.e. of all segments) is unchanged.
+            if len(manifest.segments) > self.max_segments:
+                value = self._load_segments(backend, manifest)
+                if value is not None:
+                    obsolete, manifest.segments = manifest.segments, [f"{obj.key}_{uuid.uuid4().hex}"]
+                    backend.set(manifest.segments[0], value)
+            backend.set(obj.key, manifest)
+        for key in obsolete:
+            backend.delete(key)
+        data = dict(backend_uid=backend_uid, key=obj.key, version=manifest.version)
+        return f"{self.prefix}{json.dumps(data)}"
+
+    def _try_load_lazy(self, values: List[Any], annotations: List[Any]) -> List[Any]:
+        return [ServersideProxy(value, self._try_load) if self._parse_reference(value) else value for value in values]
+
+    def _parse_reference(self, data: Any) -> Dict[str, str] | None:
+        if not isinstance(data, str):
+            return None
+        if not data.startswith(self.prefix):
+            return None
+        return json.loads(data[len(self.prefix) :])
+
     def _try_dump(self, obj: Any) -> Any:
+        if isinstance(obj, ServersideProxy):
+            # Untouched values are passed on as is. Touched values might have been modified, i.e. they are dumped.
+            if not obj._loaded:
+                return obj._reference
+            obj = Serverside(obj._value, backend=self._parse_reference(obj._reference)["backend_uid"])
         if not isinstance(obj, Serverside):
             return obj
         backend_uid = obj.backend_uid
         # If not backend it set, use the default.
         if backend_uid is None:
             backend_uid = self._default_backend.uid
-        # Dump the data.
         backend = self._backend_registry[backend_uid]
-        backend.set(obj.key, obj.value)
+        if isinstance(obj, ServersideAppend):
+            return self._append(backend, backend_uid, obj)
+        key = obj.key
+        # For content addressed values, identical payloads map to the same key, i.e. the write can be skipped.
+        content_hash = self.content_hash if obj.content_hash is None else obj.content_hash
+        if content_hash and obj.random_key:
+            key = _content_hash(obj.value)
+        # Dump the data.
+        if self.session_quota is not None and has_request_context():
+            self._charge(backend_uid, key, obj.value, content_hash)
+        if not (content_hash and backend.has(key)):
+            backend.set(key, obj.value)
         # Return lookup structure.
-        data = dict(backend_uid=backend_uid, key=obj.key)
+        data = dict(backend_uid=backend_uid, key=key)
         return f"{self.prefix}{json.dumps(data)}"
 
 
@@ -1322,10 +3488,446 @@ class Serverside(Generic[T]):
         value: T,
         key: str | None = None,
         backend: Union[ServersideBackend, str] | None = None,
+        content_hash: bool | None = None,
     ):
         self.value = value
         self.key: str = str(uuid.uuid4()) if key is None else key
+        self.random_key: bool = key is None
         self.backend_uid: str | None = backend.uid if isinstance(backend, ServersideBackend) else backend
+        # If set, overrides the content hash setting of the transform.
+        self.content_hash = content_hash
+
+
+class ServersideAppend(Serverside[T]):
+    """
+    Appends the value (e.g. the new rows of a data frame) to the value stored under the key, rather than replacing it.
+    The deltas are stored as segments, which are concatenated on load, i.e. a write costs O(delta) rather than O(total).
+    Supported types are pandas/polars data frames, pyarrow tables, numpy arrays, lists, bytes, and strings.
+    """
+
+    def __init__(self, value: T, key: str | None = None, backend: Union[ServersideBackend, str] | None = None):
+        super().__init__(value, key=key, backend=backend, content_hash=False)
+
+
+class _SegmentManifest:
+    def __init__(self, segments: List[str]):
+        self.segments = segments
+        self.version = 0
+
+
+def _concat_kind(value: Any) -> str:
+    module = type(value).__module__.split(".")[0]
+    if module in ["pandas", "polars", "numpy"]:
+        return module
+    if module == "pyarrow" and type(value).__name__ == "Table":
+        return module
+    for kind in [list, bytes, str]:
+        if isinstance(value, kind):
+            return kind.__name__
+    raise ValueError(f"Unsupported type for ServersideAppend: {type(value)}")
+
+
+def _concat(values: List[Any]) -> Any:
+    kind = _concat_kind(values[0])
+    if kind == "pandas":
+        import pandas
+
+        return pandas.concat(values)
+    if kind == "polars":
+        import polars
+
+        return polars.concat(values)
+    if kind == "numpy":
+        import numpy
+
+        return numpy.concatenate(values)
+    if kind == "pyarrow":
+        import pyarrow
+
+        return pyarrow.concat_tables(values)
+    return values[0][:0].join(values) if kind in ["bytes", "str"] else [e for value in values for e in value]
+
+
+def _component_id_key(component_id: ComponentId) -> str:
+    return json.dumps(component_id, sort_keys=True) if isinstance(component_id, dict) else component_id
+
+
+def _is_wildcard(component_id: ComponentId) -> bool:
+    return isinstance(component_id, dict) and any(v in (ALL, MATCH, ALLSMALLER) for v in component_id.values())
+
+
+def _map_outputs(data: Any, scalar: bool, outputs: List[Tuple[List[Any], Output]], func: Callable) -> Any:
+    if scalar:
+        return func(data, outputs[0][1])
+    # Copy the (outer) container, rather than modifying the object returned by the callback.
+    if isinstance(data, (list, tuple)):
+        data = list(data)
+    elif isinstance(data, dict):
+        data = dict(data)
+    else:
+        return data
+    for multi_index, output in outputs:
+        container = data
+        try:
+            for j in multi_index[:-1]:
+                container = container[j]
+            value = container[multi_index[-1]]
+        except (KeyError, IndexError, TypeError):
+            continue
+        if not isinstance(container, tuple):
+            container[multi_index[-1]] = func(value, output)
+    return data
+
+
+def _component_id_matches(pattern: ComponentId, component_id: ComponentId) -> bool:
+    if not isinstance(pattern, dict) or not isinstance(component_id, dict):
+        return pattern == component_id
+    if pattern.keys() != component_id.keys():
+        return False
+    return all(v in (ALL, MATCH, ALLSMALLER) or v == component_id[k] for k, v in pattern.items())
+
+
+def _content_hash(value: Any) -> str:
+    return hashlib.sha256(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)).hexdigest()
+
+
+class ServersideProxy:
+    """
+    Stand-in for a Serverside value, which is loaded on first use (attribute access, indexing, operators, etc.). If
+    the proxy is returned from a callback without being used, the reference is passed on, i.e. there is no load/dump
+    cycle. Note that type checks (e.g. isinstance) see the proxy, use resolve_serverside to get the actual value.
+    """
+
+    __slots__ = ("_reference", "_loader", "_value", "_loaded")
+
+    def __init__(self, reference: str, loader: Callable[[str], Any]):
+        object.__setattr__(self, "_reference", reference)
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_value", None)
+        object.__setattr__(self, "_loaded", False)
+
+    def __getattr__(self, name):
+        return getattr(_resolve_proxy(self), name)
+
+    def __setattr__(self, name, value):
+        setattr(_resolve_proxy(self), name, value)
+
+    def __delattr__(self, name):
+        delattr(_resolve_proxy(self), name)
+
+    def __repr__(self):
+        return repr(_resolve_proxy(self))
+
+    def __str__(self):
+        return str(_resolve_proxy(self))
+
+    def __bool__(self):
+        return bool(_resolve_proxy(self))
+
+    def __len__(self):
+        return len(_resolve_proxy(self))
+
+    def __iter__(self):
+        return iter(_resolve_proxy(self))
+
+    def __hash__(self):
+        return hash(_resolve_proxy(self))
+
+    def __call__(self, *args, **kwargs):
+        return _resolve_proxy(self)(*args, **kwargs)
+
+
+def _resolve_proxy(proxy: ServersideProxy) -> Any:
+    if not proxy._loaded:
+        object.__setattr__(proxy, "_value", proxy._loader(proxy._reference))
+        object.__setattr__(proxy, "_loaded", True)
+    return proxy._value
+
+
+def _bind_proxy_operators():
+    def forward(op):
+        return lambda self, *args: op(_resolve_proxy(self), *[resolve_serverside(arg) for arg in args])
+
+    def reflect(op):
+        return lambda self, other: op(resolve_serverside(other), _resolve_proxy(self))
+
+    binary = ["add", "sub", "mul", "matmul", "truediv", "floordiv", "mod", "pow", "and_", "or_", "xor"]
+    binary += ["lshift", "rshift"]
+    other = ["lt", "le", "eq", "ne", "gt", "ge", "getitem", "setitem", "delitem", "contains"]
+    other += ["neg", "pos", "abs", "invert"]
+    for name in binary + other:
+        dunder = name.rstrip("_")
+        setattr(ServersideProxy, f"__{dunder}__", forward(getattr(operator, name)))
+        if name in binary:
+            setattr(ServersideProxy, f"__r{dunder}__", reflect(getattr(operator, name)))
+
+
+_bind_proxy_operators()
+
+
+def resolve_serverside(value: Any) -> Any:
+    """
+    Returns the value behind a (lazy) Serverside proxy. Other values are returned as is.
+    """
+    if isinstance(value, ServersideProxy):
+        return _resolve_proxy(value)
+    return value
+
+
+# endregion
+
+
+# region Memoize transform
+
+
+class MemoizeTransform(DashTransform):
+    """
+    Transform that memoizes the results of callbacks with memoize=True in a ServersideBackend. Results are keyed by a
+    hash of the arguments, salted by the callback uid, so only callbacks that are pure functions of their arguments
+    should be memoized. Bump memoize_version on the callback to invalidate old results. Serverside values are hashed by
+    their reference (i.e. they are only loaded on a cache miss), so values written under a fixed key should not be
+    passed to memoized callbacks, as the reference does not change when the value is overwritten.
+
+    Callbacks with single_flight=True are deduplicated, i.e. concurrent invocations with identical arguments wait for
+    the first one to complete, and share its result. With cross_process=True, memoized callbacks are also deduplicated
+    across processes, using a lock in the backend.
+
+    If max_stale is set (stale-while-revalidate), results older than the timeout (but younger than timeout + max_stale)
+    are returned immediately, while they are refreshed in a background thread pool. It requires a timeout, and callbacks
+    that do not depend on the request context (callback_context, the Flask request, etc.), as the refresh runs after
+    the response has been sent. Callbacks that refer to the context are refused.
+    """
+
+    prefix: str = "MEMOIZE_"
+
+    def __init__(
+        self,
+        backend: ServersideBackend | None = None,
+        timeout: int | None = None,
+        cross_process: bool = False,
+        lock_timeout: int = 60,
+        poll_interval: float = 0.05,
+        max_stale: int | None = None,
+        refresh_workers: int = 4,
+    ):
+        super().__init__()
+        _validate_max_stale(timeout, max_stale)
+        # Per default, use a file system backend, separate from the one holding Serverside values (e.g. their quotas).
+        self.backend = FileSystemBackend("memoize_backend") if backend is None else backend
+        # Time to live of the results. Can be overridden per callback (memoize_timeout).
+        self.timeout = timeout
+        # Settings for cross process single flight.
+        self.cross_process = cross_process
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self._flights: Dict[str, Future] = {}
+        self._flights_lock = threading.Lock()
+        # Settings for stale-while-revalidate. Can be overridden per callback (memoize_max_stale).
+        self.max_stale = max_stale
+        self.refresh_workers = refresh_workers
+        self._refreshing: set[str] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def apply_serverside(self, callbacks):
+        for callback in callbacks:
+            if not _is_memoized(callback):
+                continue
+            f = callback.f
+            callback.f = self._memoize_callback(callback)(f)
+        return callbacks
+
+    def _memoize_callback(self, callback):
+        memoize = callback.kwargs.get("memoize", False)
+        single_flight = callback.kwargs.get("single_flight", False)
+        timeout = callback.kwargs.get("memoize_timeout", self.timeout)
+        max_stale = callback.kwargs.get("memoize_max_stale", self.max_stale)
+        _validate_max_stale(timeout, max_stale)
+        salt = f"{callback.uid}:{[str(output) for output in callback.outputs]}:{callback.kwargs.get('memoize_version')}"
+        # Serverside values are passed as lazy proxies (see the ServersideOutputTransform), which are resolved before
+        # the function is called, unless the callback asked for lazy values.
+        lazy = callback.kwargs.get("lazy", False)
+
+        def wrapper(f):
+            if max_stale is not None and _uses_context(f):
+                raise ValueError(
+                    "Stale-while-revalidate (max_stale) is not supported for callbacks that use the request context, "
+                    f"but [{callback.uid}] refers to it."
+                )
+
+            def call(*args, **kwargs):
+                if lazy:
+                    return f(*args, **kwargs)
+                return f(
+                    *[_resolve_memoize_arg(arg) for arg in args],
+                    **{k: _resolve_memoize_arg(v) for k, v in kwargs.items()},
+                )
+
+            @functools.wraps(f)
+            def decorated_function(*args, **kwargs):
+                try:
+                    key = self._key(salt, args, kwargs)
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    # Arguments that cannot be pickled are not memoized.
+                    return call(*args, **kwargs)
+                compute = functools.partial(call, *args, **kwargs)
+                if memoize:
+                    lock = single_flight and self.cross_process
+                    compute = functools.partial(self._get_or_compute, key, compute, timeout, max_stale, lock)
+                if single_flight:
+                    return self._single_flight(key, compute)
+                return compute()
+
+            # Keep the signature, it is inspected by the serialization transforms (which are applied after this one).
+            decorated_function.__signature__ = inspect.signature(f)
+            return decorated_function
+
+        return wrapper
+
+    def _get_or_compute(
+        self, key: str, compute: Callable[[], Any], timeout: int | None, max_stale: int | None, lock: bool
+    ) -> Any:
+        hit = self._lookup(key, compute, timeout, max_stale)
+        if hit is not None:
+            return hit[0]
+        if not lock:
+            return self._compute_and_set(key, compute, timeout, max_stale)
+        lock_key = f"{key}.lock"
+        while not self.backend.acquire_lock(lock_key, self.lock_timeout):
+            # Another process is computing the result, wait for it.
+            time.sleep(self.poll_interval)
+            hit = self._lookup(key, compute, timeout, max_stale)
+            if hit is not None:
+                return hit[0]
+        try:
+            # The result might have been stored while acquiring the lock.
+            hit = self._lookup(key, compute, timeout, max_stale)
+            if hit is not None:
+                return hit[0]
+            return self._compute_and_set(key, compute, timeout, max_stale)
+        finally:
+            self.backend.release_lock(lock_key)
+
+    def _lookup(
+        self, key: str, compute: Callable[[], Any], timeout: int | None, max_stale: int | None
+    ) -> Tuple[Any, float] | None:
+        # Results are stored as (result, timestamp), so that None can be memoized.
+        hit = self.backend.get(key)
+        if hit is None or max_stale is None or timeout is None:
+            return hit
+        age = time.time() - hit[1]
+        if age <= timeout:
+            return hit
+        if age > timeout + max_stale:
+            return None
+        # The result is stale, but still usable. Refresh it in the background.
+        self._refresh(key, compute, timeout, max_stale)
+        return hit
+
+    def _compute_and_set(self, key: str, compute: Callable[[], Any], timeout: int | None, max_stale: int | None) -> Any:
+        result = compute()
+        # Stale results must be kept by the backend, until they are too old to be served.
+        if timeout is not None and max_stale is not None:
+            timeout += max_stale
+        if timeout is None:
+            self.backend.set(key, (result, time.time()))
+        else:
+            self.backend.set(key, (result, time.time()), timeout=timeout)
+        return result
+
+    def _refresh(self, key: str, compute: Callable[[], Any], timeout: int, max_stale: int):
+        with self._flights_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.refresh_workers, thread_name_prefix="memoize_refresh")
+        # Run the refresh in a copy of the context, e.g. for context variables. Note that the request itself has already
+        # completed, which is why callbacks that use the request context are refused (see _uses_context).
+        context = contextvars.copy_context()
+        self._executor.submit(context.run, self._revalidate, key, compute, timeout, max_stale)
+
+    def _revalidate(self, key: str, compute: Callable[[], Any], timeout: int, max_stale: int):
+        lock_key = f"{key}.lock"
+        try:
+            # If another process is already refreshing the result, there is no need to do it again.
+            if self.cross_process and not self.backend.acquire_lock(lock_key, self.lock_timeout):
+                return
+            try:
+                self._compute_and_set(key, compute, timeout, max_stale)
+            finally:
+                if self.cross_process:
+                    self.backend.release_lock(lock_key)
+        except PreventUpdate:
+            pass
+        except Exception:
+            logging.warning("Exception raised while refreshing memoized result '%s'", key, exc_info=True)
+        finally:
+            with self._flights_lock:
+                self._refreshing.discard(key)
+
+    def _single_flight(self, key: str, compute: Callable[[], Any]) -> Any:
+        with self._flights_lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._flights[key] = Future()
+        # Followers wait for the leader, which computes the result (or raises) on their behalf. If the leader does not
+        # complete within the lock timeout (e.g. it hangs), followers compute the result themselves.
+        if not leader:
+            try:
+                return future.result(timeout=self.lock_timeout)
+            except TimeoutError:
+                if future.done():
+                    raise
+            return compute()
+        try:
+            future.set_result(compute())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+        return future.result()
+
+    def _key(self, salt: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+        # Serverside values are identified by their reference, i.e. they are not loaded (nor pickled) for hashing.
+        args = [_memoize_arg(arg) for arg in args]
+        kwargs = {key: _memoize_arg(value) for key, value in kwargs.items()}
+        return f"{self.prefix}{_content_hash((salt, args, kwargs))}"
+
+    def sort_key(self):
+        # Apply before the serialization transforms, i.e. hash the loaded arguments and memoize the raw results.
+        return -1
+
+
+def _is_memoized(callback) -> bool:
+    return bool(callback.kwargs.get("memoize", None) or callback.kwargs.get("single_flight", None))
+
+
+def _memoize_arg(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_memoize_arg(element) for element in value]
+    if isinstance(value, ServersideProxy):
+        return value._reference
+    return value
+
+
+def _resolve_memoize_arg(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_resolve_memoize_arg(element) for element in value]
+    return resolve_serverside(value)
+
+
+def _uses_context(f: Callable) -> bool:
+    # The names (globals and attributes) referred to by the function, e.g. dash.ctx or flask.request.
+    code = getattr(inspect.unwrap(f), "__code__", None)
+    return code is not None and not {"callback_context", "ctx", "request", "session"}.isdisjoint(code.co_names)
+
+
+def _validate_max_stale(timeout: int | None, max_stale: int | None):
+    # Staleness is relative to the timeout, i.e. without a timeout, results are never stale.
+    if max_stale is not None and timeout is None:
+        raise ValueError("Stale-while-revalidate (max_stale) requires a timeout.")
 
 
 # endregion
@@ -1351,34 +3953,6 @@ class Dash(DashProxy):
 # region Utils
 
 
-def _skip_inputs(args, kwargs, keys: List[Any]):
-    fltr = []
-    str_keys = [key for key in keys if isinstance(key, str)]
-    int_keys = [key for key in keys if isinstance(key, int)]
-    # Drop str keys.
-    for key in str_keys:
-        fltr.append(kwargs.pop(key))
-    # Filter the other ones.
-    if any(int_keys):
-        args = list(args)
-        fltr.extend([arg for i, arg in enumerate(args) if i in keys])
-        args = [arg for i, arg in enumerate(args) if i not in keys]
-    # TODO: Do we need to handle None?
-    return args, kwargs, fltr
-
-
-def _append_output(outputs, value, single_output, out_idx):
-    # Handle flex signature.
-    if isinstance(outputs, dict):
-        outputs[out_idx] = value
-        return outputs
-    # Handle single output.
-    if single_output:
-        return [outputs, value]
-    # Finally, the "normal" case.
-    return as_list(outputs) + [value]
-
-
 def plotly_jsonify(data):
     return json.loads(json.dumps(data, cls=plotly.utils.PlotlyJSONEncoder))
 
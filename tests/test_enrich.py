@@ -1,7 +1,10 @@
 import decimal
+import gzip
 import json
 import os
+import pickle
 import re
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
@@ -9,6 +12,7 @@ from datetime import datetime
 import dash
 import pandas as pd
 import pytest
+from cachelib.serializers import BaseSerializer
 from dash.exceptions import PreventUpdate
 from pydantic import BaseModel
 
@@ -16,28 +20,44 @@ import dash_extensions.enrich
 from dash_extensions.enrich import (
     ALL,
     MATCH,
+    ArrowSerializer,
     BaseModelTransform,
     BlockingCallbackTransform,
     CallbackBlueprint,
+    CallPlan,
+    CompressedSerializer,
     CycleBreakerInput,
     CycleBreakerTransform,
     DashBlueprint,
     DashProxy,
     DataclassTransform,
     DependencyCollection,
+    FileSystemBackend,
     Input,
+    LoadingTransform,
+    MemoizeTransform,
     MultiplexerTransform,
     Output,
+    PickleBufferSerializer,
     PrefixIdTransform,
+    SerializerError,
     Serverside,
+    ServersideAppend,
+    ServersideBackend,
     ServersideOutputTransform,
+    SharedMemoryBackend,
+    SQLiteBackend,
     State,
+    TieredBackend,
     Trigger,
     TriggerTransform,
+    WriteBehindBackend,
+    _resolve_transforms,
     callback,
     clientside_callback,
     dcc,
     html,
+    resolve_serverside,
 )
 
 # region Test utils/stubs
@@ -153,6 +173,36 @@ def test_dependency_collection(tst, flt):
     assert dc[-1] == Input("new", "prop")
 
 
+def test_dependency_collection_index():
+    dc = DependencyCollection(dict(a=Input("a", "prop"), b=[State("b", "prop"), State("c", "prop")]))
+    assert dc.index(State("c", "prop")) == 2
+    assert dc.index(Input("x", "prop")) == -1
+    # Test nested modification.
+    dc.set(["b", 1], State("d", "prop"))
+    assert dc.structure["b"][1] == State("d", "prop")
+    assert "d" not in dc.structure
+    assert dc.index(State("d", "prop")) == 2
+    assert dc.index(State("c", "prop")) == -1
+    # Test incremental indexing.
+    assert dc.append(Input("e", "prop")) == f"{dash_extensions.enrich.DEPENDENCY_APPEND_PREFIX}3"
+    assert dc.append([Input("f", "prop"), Input("g", "prop")], flex_key="fg") == "fg"
+    assert len(dc) == 6
+    assert dc.index(Input("g", "prop")) == 5
+    assert list(dc)[3:] == [Input("e", "prop"), Input("f", "prop"), Input("g", "prop")]
+    # Test in place modification (e.g. by the PrefixIdTransform), which invalidates the lookup.
+    dc[0].component_id = "prefix-a"
+    dc.invalidate()
+    assert dc.index(Input("prefix-a", "prop")) == 0
+    # Misses do not rebuild the lookup.
+    positions = dc._positions
+    assert dc.index(Input("y", "prop")) == -1 and dc._positions is positions
+    # Test wildcards.
+    dc = DependencyCollection([Input({"type": "x", "index": ALL}, "prop")])
+    assert dc.index(Input({"type": "x", "index": ALL}, "prop")) == 0
+    assert dc.append(Input("a", "prop"), index=0) == 0
+    assert dc.index(Input({"type": "x", "index": ALL}, "prop")) == 1
+
+
 def test_callback_blueprint():
     # Test single element.
     cbp = CallbackBlueprint(State("s", "prop"), Output("o", "prop"), Input("i", "prop"))
@@ -788,6 +838,865 @@ def test_serverside_output_transform_wildcard(dash_duo):  # noqa: C901
     assert dash_duo.find_element(_css_selector("log_all")).text == '{"B":{"0":1}}{"B":{"0":1}}'
 
 
+def test_tiered_backend(tmp_path):
+    backend = TieredBackend(FileSystemBackend(str(tmp_path)), max_bytes=100, size_func=len)
+    assert backend.uid == FileSystemBackend(str(tmp_path)).uid
+    # Values are written through, and served from memory afterwards.
+    backend.set("a", "x" * 60)
+    assert backend.backend.get("a") == "x" * 60
+    assert backend.get("a") == "x" * 60
+    assert backend.stats["hits"] == 1
+    # Least recently used values are evicted when the budget is exceeded.
+    backend.set("b", "y" * 60)
+    assert backend.stats["entries"] == 1
+    assert backend.get("a") == "x" * 60
+    assert backend.stats["misses"] == 1
+    # Values larger than the budget are never kept in memory.
+    backend.set("c", "z" * 200)
+    assert backend.get("c") == "z" * 200
+    assert backend.stats["misses"] == 2
+    # Check the interplay with the transform.
+    transform = ServersideOutputTransform(backends=[backend])
+    reference = transform._try_dump(Serverside(pd.DataFrame(columns=["A"], data=[1])))
+    assert transform._try_load(reference).equals(pd.DataFrame(columns=["A"], data=[1]))
+
+
+def test_serverside_content_hash(tmp_path):
+    backend = FileSystemBackend(str(tmp_path))
+    transform = ServersideOutputTransform(backends=[backend], content_hash=True)
+    df = pd.DataFrame(columns=["A"], data=[1])
+    # Identical values map to the same key.
+    reference = transform._try_dump(Serverside(df))
+    assert transform._try_dump(Serverside(df.copy())) == reference
+    assert transform._try_dump(Serverside(pd.DataFrame(columns=["A"], data=[2]))) != reference
+    assert len(list(backend._list_dir())) == 2
+    assert transform._try_load(reference).equals(df)
+    # Explicit keys and per-value settings take precedence.
+    assert "my_key" in transform._try_dump(Serverside(df, key="my_key"))
+    assert transform._try_dump(Serverside(df, content_hash=False)) != reference
+
+
+def test_arrow_serializer(tmp_path):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("pyarrow")
+    backend = FileSystemBackend(str(tmp_path), serializer=ArrowSerializer())
+    df = pd.DataFrame(dict(a=[1, 2, 3], b=["x", "y", "z"]))
+    array = np.arange(12.0).reshape(3, 4)
+    for key, value in dict(df=df, array=array, other=dict(a=1)).items():
+        backend.set(key, value)
+    assert backend.get("df").equals(df)
+    assert backend.get("df", ignore_expired=True).equals(df)
+    assert np.array_equal(backend.get("array"), array)
+    assert backend.get("other") == dict(a=1)
+    # Check the bytes interface, including values that fall back to pickle.
+    serializer = ArrowSerializer()
+    assert serializer.loads(serializer.dumps(df)).equals(df)
+    assert serializer.loads(serializer.dumps("value")) == "value"
+
+
+def test_write_behind_backend(tmp_path):
+    release = threading.Event()
+
+    class SlowBackend(FileSystemBackend):
+        def set(self, key, value, *args, **kwargs):
+            release.wait(timeout=5)
+            return super().set(key, value, *args, **kwargs)
+
+    backend = WriteBehindBackend(SlowBackend(str(tmp_path), threshold=0))
+    # Pending values are served from the staging map.
+    backend.set("a", 1)
+    backend.set("a", 2)
+    assert backend.pending == 1
+    assert backend.has("a")
+    assert backend.get("a") == 2
+    assert backend.backend.get("a") is None
+    # After the write completes, values are served from the wrapped backend.
+    release.set()
+    backend.flush()
+    assert backend.pending == 0
+    assert backend.backend.get("a") == 2
+    assert backend.get("a") == 2
+
+
+def test_serverside_output_transform_batch_load(tmp_path):
+    calls = []
+
+    class CountingBackend(FileSystemBackend):
+        def get_many(self, *keys, ignore_expired=False):
+            calls.append(keys)
+            return super().get_many(*keys, ignore_expired=ignore_expired)
+
+    backend = CountingBackend(str(tmp_path))
+    transform = ServersideOutputTransform(backends=[backend])
+    a, b, c = [transform._try_dump(Serverside(value)) for value in ["a", "b", "c"]]
+    callback_blueprint = CallbackBlueprint(
+        Output("out", "children"), Input("x", "value"), Input("y", "value"), Input("z", "value")
+    )
+    callback_blueprint.f = lambda x, y, z: x + "".join(y) + z
+    transform.apply_serverside([callback_blueprint])
+    # All references (including list elements) are resolved in one batch.
+    assert callback_blueprint.f(a, [b, c], "d") == "abcd"
+    assert len(calls) == 1
+    backend.set_many(dict(d="d", e="e"))
+    assert backend.get_many("d", "missing", "e") == ["d", None, "e"]
+
+
+def test_compressed_serializer(tmp_path):
+    small, large = "x" * 10, "x" * 10000
+    # Write uncompressed entries first, and then check that they coexist with compressed entries.
+    FileSystemBackend(str(tmp_path)).set("existing", large)
+    serializer = CompressedSerializer(codec="lzma", threshold=1000)
+    backend = FileSystemBackend(str(tmp_path), serializer=serializer)
+    backend.set("small", small)
+    backend.set("large", large)
+    assert backend.get("existing") == large
+    assert backend.get("small") == small
+    assert backend.get("large", ignore_expired=True) == large
+    assert serializer.stats["compressed"] == 1
+    assert serializer.stats["ratio"] > 10
+    # Entries can be loaded with another codec.
+    assert CompressedSerializer().loads(serializer.dumps(large)) == large
+    with pytest.raises(ValueError):
+        CompressedSerializer(codec="gzip")
+
+
+@pytest.mark.parametrize("eviction_policy", ["lru", "lfu", "ttl"])
+def test_file_system_backend_quota(tmp_path, eviction_policy):
+    backend = FileSystemBackend(str(tmp_path), max_bytes=3500, eviction_policy=eviction_policy, min_idle=0)
+    for i, key in enumerate(["a", "b", "c"]):
+        backend.set(key, "x" * 1000, timeout=100 + i)
+        os.utime(backend._get_filename(key), (i, i))
+    backend.get("a")
+    # Writes do not evict, compaction does.
+    backend.set("d", "x" * 1000, timeout=1000)
+    assert backend.compact() > 0
+    assert backend.compact() == 0
+    remaining = [key for key in ["a", "b", "c", "d"] if backend.has(key)]
+    assert remaining == (["b", "c", "d"] if eviction_policy == "ttl" else ["a", "c", "d"])
+    # Recently accessed entries are never evicted.
+    backend.min_idle = 3600
+    backend.set("e", "x" * 1000)
+    assert backend.compact() > 0
+    assert backend.has("d") and backend.has("e")
+
+
+def test_file_system_backend_sharding(tmp_path):
+    flat = FileSystemBackend(str(tmp_path))
+    for key in ["a", "b", "c"]:
+        flat.set(key, key)
+    # Existing (flat) caches are migrated to the sharded layout.
+    backend = FileSystemBackend(str(tmp_path), shard_depth=2)
+    assert backend.get("a") is None
+    assert backend.migrate() == 4  # incl. the file count
+    assert backend.get("a") == "a"
+    assert backend.get("b", ignore_expired=True) == "b"
+    name = os.path.basename(backend._get_filename("c"))
+    assert backend._get_filename("c") == os.path.join(str(tmp_path), name[:2], name[2:4], name)
+    # New entries are sharded, and all entries are visible to pruning.
+    backend.set("d", "d")
+    assert len(list(backend._list_dir())) == 4
+    assert all(os.path.isdir(os.path.join(str(tmp_path), name)) for name in os.listdir(str(tmp_path)))
+    # And back again.
+    assert FileSystemBackend(str(tmp_path)).migrate() == 5
+    assert flat.get("d") == "d"
+
+
+def test_serverside_output_transform_lazy(tmp_path):
+    loaded = []
+
+    class CountingBackend(FileSystemBackend):
+        def get(self, key, ignore_expired=False):
+            loaded.append(key)
+            return super().get(key, ignore_expired=ignore_expired)
+
+    transform = ServersideOutputTransform(backends=[CountingBackend(str(tmp_path), threshold=0)], lazy=True)
+    reference = transform._try_dump(Serverside(pd.DataFrame(columns=["A"], data=[1])))
+    forward = CallbackBlueprint(Output("a", "children"), Input("x", "value"))
+    forward.f = lambda x: x
+    use = CallbackBlueprint(Output("b", "children"), Input("x", "value"))
+    use.f = lambda x: x["A"].sum()
+    touch = CallbackBlueprint(Output("c", "children"), Input("x", "value"))
+    touch.f = lambda x: x if len(x) == 1 else None
+    eager = CallbackBlueprint(Output("d", "children"), Input("x", "value"), lazy=False)
+    eager.f = lambda x: isinstance(x, pd.DataFrame)
+    transform.apply_serverside([forward, use, touch, eager])
+    # Untouched values are passed on without loading.
+    assert forward.f(reference) == reference
+    assert len(loaded) == 0
+    # Values are loaded on first use.
+    assert use.f(reference) == 1
+    assert len(loaded) == 1
+    # Touched values (which might have been modified) are dumped again.
+    touched_reference = touch.f(reference)
+    assert touched_reference != reference
+    assert transform._try_load(touched_reference).equals(transform._try_load(reference))
+    assert isinstance(resolve_serverside(transform._try_load_lazy([reference], [None])[0]), pd.DataFrame)
+    # Laziness can be disabled per callback.
+    assert eager.f(reference) is True
+
+
+def test_sqlite_backend(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "serverside.sqlite"))
+    df = pd.DataFrame(columns=["A"], data=[1])
+    backend.set("df", df)
+    backend.set("expired", "x" * 100, timeout=-1)
+    assert backend.get("df").equals(df)
+    assert backend.has("df")
+    # Expired values can still be read, until they are evicted.
+    assert not backend.has("expired")
+    assert backend.get("expired") is None
+    assert backend.get("expired", ignore_expired=True) == "x" * 100
+    assert backend.get_many("df", "missing", "expired", ignore_expired=True)[1:] == [None, "x" * 100]
+    assert backend.evict() == 1
+    # Values are accessible from other threads (and connections).
+    backend.set_many(dict(a="a" * 100, b="b" * 100))
+    result = []
+    thread = threading.Thread(target=lambda: result.extend(backend.get_many("a", "b")))
+    thread.start()
+    thread.join()
+    assert result == ["a" * 100, "b" * 100]
+    # The connections of threads are closed when they exit, or on close (and reopened on use).
+    assert len(backend._connections) == 1
+    backend.close()
+    assert backend.get("a") == "a" * 100
+    # Evict oldest entries to fit within the budget.
+    assert backend.evict(max_bytes=250) == 1
+    assert backend.get("df") is None
+    backend.vacuum()
+    # Check the interplay with the transform.
+    transform = ServersideOutputTransform(backends=[backend])
+    assert transform._try_load(transform._try_dump(Serverside(df))).equals(df)
+
+
+def test_shared_memory_backend(tmp_path):
+    np = pytest.importorskip("numpy")
+    index_path = str(tmp_path / "index.sqlite")
+    backend, other = SharedMemoryBackend(index_path), SharedMemoryBackend(index_path)
+    periodic = SharedMemoryBackend(index_path, release_interval=0)
+    try:
+        array = np.arange(12, dtype="float64").reshape(3, 4)
+        backend.set("array", array)
+        backend.set("df", pd.DataFrame(columns=["A"], data=[1]))
+        # Another process (here emulated by another instance) attaches to the same segment without copying.
+        view = other.get("array")
+        np.testing.assert_array_equal(view, array)
+        assert not view.flags.writeable
+        assert np.shares_memory(view, other.get("array"))
+        assert other.get("df").equals(pd.DataFrame(columns=["A"], data=[1]))
+        # Overwriting a key unlinks the old segment.
+        backend.set("array", array * 2)
+        np.testing.assert_array_equal(other.get("array"), array * 2)
+        # Evict the oldest entries, and release the segments no longer referenced.
+        del view
+        assert backend.evict(max_bytes=array.nbytes) == 1
+        assert other.get("df") is None
+        other.release()
+        assert len(other._segments) == 1
+        # Segments are released periodically, also when they were removed by another process.
+        backend.set("df", pd.DataFrame(columns=["A"], data=[1]))
+        name = periodic.index.get("df")["name"]
+        periodic.get("df")
+        backend.delete("df")
+        periodic.get("array")
+        assert name not in periodic._segments
+        # A segment, which could not be indexed, is removed.
+        names = set(backend._segments)
+        backend.index.set = None
+        with pytest.raises(TypeError):
+            backend.set("array", array)
+        del backend.index.set
+        assert set(backend._segments) == names
+    finally:
+        for key in ["array", "df"]:
+            backend.delete(key)
+        backend.close()
+        other.close()
+        periodic.close()
+
+
+def test_memoize_transform(tmp_path):
+    calls = []
+
+    def total(x, y):
+        calls.append((x, y))
+        return None if x is None else x["A"].sum() + y
+
+    serverside = ServersideOutputTransform(backends=[FileSystemBackend(str(tmp_path / "serverside"))])
+    memoize = MemoizeTransform(backend=FileSystemBackend(str(tmp_path / "memoize")))
+    # The memoize transform is applied first, i.e. it sees the loaded (or lazy) arguments.
+    transforms = _resolve_transforms([serverside, memoize])
+    assert transforms == [memoize, serverside]
+    reference = serverside._try_dump(Serverside(pd.DataFrame(columns=["A"], data=[1])))
+    memoized = CallbackBlueprint(Output("a", "children"), Input("x", "data"), Input("y", "value"), memoize=True)
+    memoized.f = total
+    expired = CallbackBlueprint(
+        Output("b", "children"), Input("x", "data"), Input("y", "value"), memoize=True, memoize_timeout=-1
+    )
+    expired.f = total
+    callbacks = [memoized, expired]
+    for transform in transforms:
+        callbacks, _ = transform.apply(callbacks, [])
+    # Results are memoized on the arguments, the function sees the loaded values.
+    assert [memoized.f(reference, 1), memoized.f(reference, 1), memoized.f(reference, 2)] == [2, 2, 3]
+    assert len(calls) == 2 and isinstance(calls[0][0], pd.DataFrame)
+    # Serverside values are hashed by reference, i.e. they are not loaded on a cache hit.
+    serverside._default_backend.delete(serverside._parse_reference(reference)["key"])
+    assert memoized.f(reference, 1) == 2 and len(calls) == 2
+    reference = serverside._try_dump(Serverside(pd.DataFrame(columns=["A"], data=[1])))
+    # None is a valid result.
+    assert memoized.f(None, 1) is None and memoized.f(None, 1) is None
+    assert len(calls) == 3
+    # Results are salted per callback, and expire.
+    assert [expired.f(reference, 1), expired.f(reference, 1)] == [2, 2]
+    assert len(calls) == 5
+
+
+def test_memoize_transform_single_flight(tmp_path):
+    calls, started, release = [], threading.Event(), threading.Event()
+
+    def slow(x):
+        calls.append(x)
+        started.set()
+        release.wait(5)
+        if x is None:
+            raise PreventUpdate
+        return x * 2
+
+    def invoke(f, x, results):
+        try:
+            results.append(f(x))
+        except PreventUpdate as e:
+            results.append(e)
+
+    backend = FileSystemBackend(str(tmp_path), threshold=0)
+    # Emulate two processes by two transforms, which share only the backend.
+    transforms = [MemoizeTransform(backend=backend, cross_process=True, poll_interval=0.01) for _ in range(2)]
+    callbacks = []
+    for transform, memoize in zip(transforms + [MemoizeTransform(backend=backend)], [True, True, False]):
+        callback_blueprint = CallbackBlueprint(Output("a", "children"), Input("x", "value"), single_flight=True)
+        callback_blueprint.kwargs["memoize"] = memoize
+        callback_blueprint.f = slow
+        callbacks.append(transform.apply_serverside([callback_blueprint])[0])
+    for x, callback_blueprints in [(1, callbacks[:2] * 3), (None, [callbacks[2]] * 3)]:
+        for event in [started, release]:
+            event.clear()
+        calls, results, threads = [], [], []
+        for callback_blueprint in callback_blueprints:
+            threads.append(threading.Thread(target=invoke, args=(callback_blueprint.f, x, results)))
+            threads[-1].start()
+            started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join()
+        # The function is invoked only once, and all callers share the result (or the exception).
+        assert calls == [x]
+        assert len(results) == len(callback_blueprints)
+        assert all(r == 2 for r in results) if x == 1 else all(isinstance(r, PreventUpdate) for r in results)
+
+    # Followers do not wait for a hanging leader longer than the lock timeout, but compute the result themselves.
+    def hang(x):
+        calls.append(x)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+        return x * 2
+
+    hanging = CallbackBlueprint(Output("a", "children"), Input("x", "value"), single_flight=True)
+    hanging.f = hang
+    hanging = MemoizeTransform(backend=backend, lock_timeout=0.1).apply_serverside([hanging])[0]
+    calls, results = [], []
+    started.clear()
+    release.clear()
+    thread = threading.Thread(target=invoke, args=(hanging.f, 3, results))
+    thread.start()
+    started.wait(5)
+    assert hanging.f(3) == 6 and calls == [3, 3]
+    release.set()
+    thread.join()
+    # Check the lock primitives of the other backends.
+    sqlite_backend = SQLiteBackend(str(tmp_path / "serverside.sqlite"))
+    for lock_backend in [backend, sqlite_backend]:
+        assert lock_backend.acquire_lock("lock", timeout=60)
+        assert not lock_backend.acquire_lock("lock", timeout=60)
+        lock_backend.release_lock("lock")
+        assert lock_backend.acquire_lock("lock", timeout=0)
+        # Stale locks can be acquired again.
+        time.sleep(0.01)
+        assert lock_backend.acquire_lock("lock", timeout=60)
+    # Stale SQLite locks are not released by their previous owner.
+    assert sqlite_backend.acquire_lock("stale", timeout=0)
+    time.sleep(0.01)
+    assert SQLiteBackend(sqlite_backend.path).acquire_lock("stale", timeout=60)
+    sqlite_backend.release_lock("stale")
+    assert not sqlite_backend.acquire_lock("stale", timeout=60)
+    # Stale locks are taken over by one process only, and are not released by their previous owner.
+    assert backend.acquire_lock("stale", timeout=0)
+    time.sleep(0.01)
+    barrier, acquired = threading.Barrier(8), []
+
+    def take_over():
+        other = FileSystemBackend(str(tmp_path))
+        barrier.wait(5)
+        if other.acquire_lock("stale", timeout=60):
+            acquired.append(other)
+
+    threads = [threading.Thread(target=take_over) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(acquired) == 1
+    backend.release_lock("stale")
+    assert not backend.acquire_lock("stale", timeout=60)
+    acquired[0].release_lock("stale")
+    assert backend.acquire_lock("stale", timeout=60)
+
+
+@pytest.mark.parametrize("wrapper", [TieredBackend, WriteBehindBackend])
+def test_memoize_transform_timeout(wrapper):
+    class ExpiringBackend(ServersideBackend):
+        def __init__(self):
+            self.entries = {}
+
+        def get(self, key, ignore_expired=False):
+            value, expires = self.entries.get(key, (None, float("inf")))
+            return value if ignore_expired or time.time() < expires else None
+
+        def set(self, key, value, timeout=None):
+            self.entries[key] = (value, time.time() + timeout if timeout else float("inf"))
+            return True
+
+    calls = []
+
+    def load(x):
+        calls.append(x)
+        return len(calls)
+
+    backend = wrapper(ExpiringBackend())
+    transform = MemoizeTransform(backend=backend, timeout=1)
+    callback_blueprint = CallbackBlueprint(Output("a", "children"), Input("x", "value"), memoize=True)
+    callback_blueprint.f = load
+    transform.apply_serverside([callback_blueprint])
+    assert callback_blueprint.f(1) == 1
+    if isinstance(backend, WriteBehindBackend):
+        backend.flush()
+    assert callback_blueprint.f(1) == 1
+    # The timeout is passed on to the wrapped backend, and expired results are not served from memory.
+    time.sleep(1.05)
+    assert callback_blueprint.f(1) == 2
+
+
+def test_memoize_transform_stale_while_revalidate():
+    class DictBackend(ServersideBackend):
+        def __init__(self):
+            self.entries = {}
+
+        def get(self, key, ignore_expired=False):
+            return self.entries.get(key)
+
+        def set(self, key, value, timeout=None):
+            self.entries[key] = value
+            return True
+
+    calls = []
+
+    def load(x):
+        calls.append(x)
+        return len(calls)
+
+    backend = DictBackend()
+    transform = MemoizeTransform(backend=backend, timeout=10, max_stale=100)
+    callback_blueprint = CallbackBlueprint(Output("a", "children"), Input("x", "value"), memoize=True)
+    callback_blueprint.f = load
+    transform.apply_serverside([callback_blueprint])
+    assert callback_blueprint.f(1) == 1
+    assert callback_blueprint.f(1) == 1
+    (key,) = backend.entries
+
+    def age(seconds):
+        value, timestamp = backend.entries[key]
+        backend.entries[key] = (value, timestamp - seconds)
+
+    # Stale results are returned immediately, and refreshed in the background.
+    age(50)
+    assert callback_blueprint.f(1) == 1
+    while transform._refreshing:
+        time.sleep(0.01)
+    assert len(calls) == 2
+    assert callback_blueprint.f(1) == 2
+    # Results that are too old are recomputed.
+    age(500)
+    assert callback_blueprint.f(1) == 3
+    assert len(calls) == 3
+    # Without a timeout, results are never stale.
+    with pytest.raises(ValueError):
+        MemoizeTransform(backend=backend, max_stale=100)
+    callback_blueprint = CallbackBlueprint(
+        Output("a", "children"), Input("x", "value"), memoize=True, memoize_timeout=None
+    )
+    callback_blueprint.f = load
+    with pytest.raises(ValueError):
+        transform.apply_serverside([callback_blueprint])
+    # Callbacks that use the request context are refused, as the refresh runs after the response has been sent.
+    callback_blueprint = CallbackBlueprint(Output("a", "children"), Input("x", "value"), memoize=True)
+    callback_blueprint.f = lambda x: dash.ctx.triggered_id
+    with pytest.raises(ValueError):
+        transform.apply_serverside([callback_blueprint])
+
+
+def test_serverside_output_transform_spill(tmp_path):
+    transform = ServersideOutputTransform(backends=[FileSystemBackend(str(tmp_path))], spill_threshold=1000)
+    blueprint = DashBlueprint(transforms=[transform])
+    stores = [dcc.Store(id="store"), dcc.Store(id="client"), dcc.Store(id={"type": "store", "index": 0})]
+    blueprint.layout = html.Div(stores + [html.Div(id="div")])
+    outputs = [Output("store", "data"), Output("client", "data"), Output({"type": "store", "index": 0}, "data")]
+    blueprint.callback(outputs + [Output("div", "children")], Input("x", "value"))(lambda x: [x] * 4)
+    blueprint.clientside_callback("function(x){return x;}", Output("y", "children"), Input("client", "data"))
+    # Reference safety is determined when the callbacks are resolved (not when the layout is served).
+    (callback_blueprint,), _ = blueprint._resolve_callbacks()
+    # Small values are passed on as is.
+    assert callback_blueprint.f("x") == ["x"] * 4
+    assert len(transform.spills) == 0
+    # Large values are stored server side, but only for reference safe targets.
+    large = list(range(1000))
+    result = callback_blueprint.f(large)
+    assert [transform._parse_reference(value) is not None for value in result] == [True, False, True, False]
+    assert transform._try_load(result[0]) == large
+    assert len(transform.spills) == 2
+    # Targets in layout functions are never spilled, as they cannot be determined up front.
+    transform = ServersideOutputTransform(backends=[FileSystemBackend(str(tmp_path))], spill_threshold=1000)
+    blueprint = DashBlueprint(transforms=[transform])
+    blueprint.layout = lambda: html.Div(dcc.Store(id="store"))
+    blueprint.callback(Output("store", "data"), Input("x", "value"))(lambda x: x)
+    (callback_blueprint,), _ = blueprint._resolve_callbacks()
+    assert callback_blueprint.f(large) == large
+
+
+def test_serverside_output_transform_reuse_keys(tmp_path):
+    deletes = []
+
+    class CountingBackend(FileSystemBackend):
+        def delete(self, key, *args, **kwargs):
+            deletes.append(key)
+            return super().delete(key, *args, **kwargs)
+
+    backend = CountingBackend(str(tmp_path), threshold=0)
+    transform = ServersideOutputTransform(backends=[backend], reuse_keys=True)
+    callback_blueprint = CallbackBlueprint(Output("store", "data"), Output("div", "children"), Input("x", "value"))
+    callback_blueprint.f = lambda x: [x, "div"]
+    transform.apply_serverside([callback_blueprint])
+    server = dash.Dash().server
+    server.secret_key = "secret"
+    with server.test_request_context():
+        # Values of the same output (and session) are written to the same key, i.e. storage is bounded by the outputs.
+        first, _ = callback_blueprint.f(Serverside("a"))
+        second, div = callback_blueprint.f(Serverside("b"))
+        assert first != second
+        assert transform._parse_reference(first)["key"] == transform._parse_reference(second)["key"]
+        assert transform._try_load(second) == "b" and div == "div"
+        assert len(list(backend._list_dir())) == 1
+        # Superseded values are deleted, except for content addressed values.
+        callback_blueprint.f(Serverside("c", content_hash=True))
+        assert len(list(backend._list_dir())) == 1
+        assert callback_blueprint.f("d") == ["d", "div"]
+        assert len(list(backend._list_dir())) == 1
+        # Plain values only delete the previous value of the output, if it was stored server side.
+        deletes.clear()
+        for _ in range(3):
+            callback_blueprint.f("d")
+        assert deletes == []
+    with server.test_request_context():
+        # Other sessions use other keys.
+        third, _ = callback_blueprint.f(Serverside("e"))
+        assert transform._parse_reference(third)["key"] != transform._parse_reference(second)["key"]
+
+
+def test_serverside_output_transform_session_quota(tmp_path):
+    backend = FileSystemBackend(str(tmp_path), threshold=0)
+    evict = ServersideOutputTransform(backends=[backend], session_quota=2500)
+    reject = ServersideOutputTransform(backends=[backend], session_quota=2500, quota_policy="reject")
+    server = dash.Dash().server
+    server.secret_key = "secret"
+    with server.test_request_context():
+        # The oldest values of the session are evicted, when the quota is exceeded.
+        references = [evict._try_dump(Serverside(c * 1000)) for c in [b"a", b"b", b"c"]]
+        assert [evict._try_load(reference) for reference in references] == [None, b"b" * 1000, b"c" * 1000]
+        usage = evict.session_usage()
+        assert usage["bytes"] == 2000 and len(usage["entries"]) == 2
+        # Or the write is rejected.
+        with pytest.raises(ValueError):
+            reject._try_dump(Serverside(b"d" * 1000))
+    with server.test_request_context():
+        # Other sessions have their own quota.
+        assert reject._try_load(reject._try_dump(Serverside(b"d" * 1000))) == b"d" * 1000
+        # Ledger updates are never made without the lock.
+        lock_key = f"{reject._ledger_key(dash_extensions.enrich._get_session_id())}.lock"
+        assert backend.acquire_lock(lock_key, timeout=60)
+        with pytest.raises(TimeoutError):
+            with reject._locked(backend, lock_key, timeout=0):
+                pass
+        backend.release_lock(lock_key)
+        # Locks are per key, i.e. a held lock does not block updates of other keys.
+        with reject._locked(backend, lock_key):
+            with reject._locked(backend, "other.lock", timeout=0):
+                assert len(reject._key_locks) == 2
+        assert not reject._key_locks
+    with server.test_request_context():
+        # Appended values (i.e. the manifest and its segments) are charged, and evicted, as one unit.
+        evict = ServersideOutputTransform(backends=[backend], session_quota=2500, max_segments=2)
+        first = evict._try_dump(Serverside(b"x" * 1000))
+        for c in [b"a", b"b", b"c"]:
+            evict._try_dump(ServersideAppend(c * 500, key="stream"))
+        usage = evict.session_usage()
+        assert [entry[0] for entry in usage["entries"]] == [evict._parse_reference(first)["key"], "stream"]
+        assert usage["bytes"] == 2500
+        reference = evict._try_dump(ServersideAppend(b"d" * 500, key="stream"))
+        assert evict._try_load(first) is None
+        assert evict._try_load(reference) == b"".join(c * 500 for c in [b"a", b"b", b"c", b"d"])
+        files = len(list(backend._list_dir()))
+        evict._try_dump(Serverside(b"y" * 1000))
+        assert evict._try_load(reference) is None
+        assert len(list(backend._list_dir())) < files - 1
+    with pytest.raises(ValueError):
+        ServersideOutputTransform(backends=[backend], quota_policy="unknown")
+
+
+def test_serverside_append(tmp_path):
+    backend = FileSystemBackend(str(tmp_path), threshold=0)
+    transform = ServersideOutputTransform(backends=[backend], max_segments=3)
+    frames = [pd.DataFrame(dict(A=[i, i])) for i in range(6)]
+    # An existing value becomes the base segment.
+    references = [transform._try_dump(Serverside(frames[0], key="stream"))]
+    for frame in frames[1:]:
+        references.append(transform._try_dump(ServersideAppend(frame, key="stream")))
+        assert len(set(references)) == len(references)
+    assert transform._try_load(references[-1]).equals(pd.concat(frames))
+    assert transform._try_load_many([references[-1]], [None])[0].equals(pd.concat(frames))
+    # Segments are compacted, i.e. the number of files is bounded (segments + manifest).
+    assert len(list(backend._list_dir())) <= transform.max_segments + 1
+    # Other types.
+    transform._try_dump(ServersideAppend([1, 2], key="list"))
+    assert transform._try_load(transform._try_dump(ServersideAppend([3], key="list"))) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        transform._try_dump(ServersideAppend({"a": 1}, key="dict"))
+    with pytest.raises(ValueError):
+        transform._try_dump(ServersideAppend([1]))
+
+
+def test_pickle_buffer_serializer(tmp_path):
+    np = pytest.importorskip("numpy")
+    array = np.arange(100000, dtype="float64")
+    df = pd.DataFrame(dict(A=array, B=array * 2))
+    # Existing (in-band) entries remain readable.
+    FileSystemBackend(str(tmp_path), serializer=BaseSerializer()).set("existing", df)
+    backend = FileSystemBackend(str(tmp_path))
+    assert isinstance(backend.serializer, PickleBufferSerializer)
+    backend.set("array", array)
+    backend.set("df", df)
+    backend.set("small", "small")
+    assert backend.get("existing").equals(df)
+    np.testing.assert_array_equal(backend.get("array"), array)
+    assert backend.get("array").flags.writeable
+    assert backend.get("df").equals(df)
+    assert backend.get("small") == "small"
+    # With mmap, the buffers are mapped rather than read.
+    mapped = FileSystemBackend(str(tmp_path), serializer=PickleBufferSerializer(mmap=True)).get("array")
+    np.testing.assert_array_equal(mapped, array)
+    assert not mapped.flags.writeable
+    # The bytes interface (used by e.g. the SQLiteBackend).
+    serializer = PickleBufferSerializer()
+    assert serializer.loads(serializer.dumps(df)).equals(df)
+    assert serializer.loads(pickle.dumps("legacy")) == "legacy"
+
+
+def test_file_system_backend_concurrent_writes(tmp_path):
+    backend = FileSystemBackend(str(tmp_path), threshold=0)
+    values = [str(i) * 100000 for i in range(4)]
+    errors, stop = [], threading.Event()
+
+    def write(value):
+        for _ in range(20):
+            backend.set("key", value)
+
+    def read():
+        while not stop.is_set():
+            if backend.get("key", ignore_expired=True) not in values:
+                errors.append("torn read")
+
+    backend.set("key", values[0])
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    writers = [threading.Thread(target=write, args=(value,)) for value in values]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    assert not errors
+    # Neither temporary files nor lock files are visible as entries.
+    assert len(list(backend._list_dir())) == 1
+    # Failed reads are retried, e.g. while a (non-atomic) writer completes the file.
+    filename = backend._get_filename("key")
+    with open(filename, "r+b") as f:
+        f.truncate(10)
+    timer = threading.Timer(0.01, lambda: backend.set("key", "repaired"))
+    timer.start()
+    assert backend.get("key") == "repaired"
+    timer.join()
+    # Also when the serializer raises its own error types (e.g. zlib.error) on truncated data.
+    backend = FileSystemBackend(str(tmp_path), threshold=0, serializer=CompressedSerializer(threshold=0))
+    backend.set("key", values[0])
+    with open(filename, "r+b") as f:
+        f.truncate(20)
+    with open(filename, "rb") as f, pytest.raises(SerializerError):
+        f.seek(4)
+        backend.serializer.load(f)
+    timer = threading.Timer(0.01, lambda: backend.set("key", "repaired"))
+    timer.start()
+    assert backend.get("key") == "repaired"
+    timer.join()
+    # Corrupt (but complete) entries are not retried.
+    for serializer, offset in [(PickleBufferSerializer(), 4), (CompressedSerializer(threshold=0), 20)]:
+        backend = FileSystemBackend(str(tmp_path), threshold=0, serializer=serializer, read_retry_delay=10)
+        backend.set("key", values[0])
+        with open(filename, "r+b") as f:
+            f.seek(offset)
+            f.write(b"\xff" * 64)
+        tic = time.perf_counter()
+        assert backend.get("key") is None
+        assert time.perf_counter() - tic < 1
+
+
+def test_call_plan(monkeypatch):
+    @dataclass
+    class Point:
+        x: int
+
+    bp = DashBlueprint(
+        transforms=[TriggerTransform(), LoadingTransform(), BlockingCallbackTransform(), DataclassTransform()]
+    )
+
+    def f(point: Point, y):
+        return [point.x, Point(x=y)]
+
+    bp.callback(
+        Output("a", "children"),
+        Output("b", "children"),
+        Trigger("btn", "n_clicks"),
+        Input("point", "data"),
+        State("y", "value"),
+        loading=True,
+        blocking=True,
+    )(f)
+    callback_blueprint = bp._resolve_callbacks()[0][0]
+    assert len(callback_blueprint.inputs) == 5 and len(callback_blueprint.outputs) == 4
+    # The steps of all transforms are compiled into a single function.
+    assert callback_blueprint.f.__wrapped__ is f
+    result = callback_blueprint.f(1, dict(x=1), 2, 123, None)
+    assert result[:3] == [1, dict(x=2), dash.no_update] and isinstance(result[3], float)
+    # Arguments that fail to load are covered by the guard too.
+    monkeypatch.setattr(dash_extensions.enrich, "_determine_outputs", lambda single_output: [dash.no_update] * 3)
+    result = callback_blueprint.f(1, dict(z=1), 2, 123, None)
+    assert result[:3] == [dash.no_update] * 3 and isinstance(result[3], float)
+    # Skipped inputs (incl. flex keys), guards, and appended outputs (incl. flex outputs).
+    skipped = []
+    plan = CallPlan().skip_inputs([1, "s"], skipped.extend).guard(lambda e: "fallback")
+    compiled = plan.append_output("o", lambda: 1, single_output=True).compile(lambda x, **kwargs: 1 / x)
+    assert compiled(1, 2, s=3) == [1.0, 1] and skipped == [2, 3]
+    assert compiled(0, 2, s=3) == ["fallback", 1]
+    assert CallPlan().append_output("o", lambda: 1, single_output=False).compile(lambda: dict(a=0))() == dict(a=0, o=1)
+    with pytest.raises(ZeroDivisionError):
+        CallPlan().skip_inputs([0]).compile(lambda x: 1 / x)(1, 0)
+    # Argument mappers recorded before a guard are covered by it, those recorded after it are not.
+    plan = CallPlan().map_args(lambda args, kwargs: 1 / args[0]).guard(lambda e: "fallback")
+    assert plan.compile(lambda x: x)(0) == "fallback"
+    with pytest.raises(ZeroDivisionError):
+        plan.map_args(lambda args, kwargs: 1 / args[1]).compile(lambda x, y: x)(1, 0)
+
+
+def test_serialization_transform_loaders():
+    @dataclass
+    class Point:
+        x: int
+
+    transform = DataclassTransform()
+    assert transform._resolve_loader(int) is None
+    assert transform._resolve_loader(Point | None)('{"x": 1}') == Point(1)
+    assert BaseModelTransform()._resolve_loader(Point) is None
+    calls = []
+
+    def f(points: Point, other, flex: Point | None = None):
+        calls.append((points, other, flex))
+
+    callback_blueprint = CallbackBlueprint(
+        Output("o", "children"), Input({"type": "p", "index": ALL}, "data"), Input("other", "data")
+    )
+    callback_blueprint.f = f
+    plain = CallbackBlueprint(Output("o", "children"), Input("x", "data"))
+    plain.f = lambda x: x
+    transform.apply_serverside([callback_blueprint, plain])
+    # Arguments are loaded according to the annotation of their parameter, others are passed on as is.
+    other = [dict(x=3)]
+    callback_blueprint.f([dict(x=1), '{"x": 2}'], other, flex=dict(x=4))
+    assert calls == [([Point(1), Point(2)], other, Point(4))] and calls[0][1] is other
+    # Callbacks without any annotated parameters skip loading altogether.
+    assert [kind for kind, _ in plain.plan.steps] == ["outputs"]
+
+
+def test_dash_proxy_compile():
+    app = DashProxy(transforms=[TriggerTransform()], include_global_callbacks=False, eager=True)
+    app.layout = html.Div([html.Button(id="btn"), html.Div(id="log")])
+
+    @app.callback(Output("log", "children"), Trigger("btn", "n_clicks"))
+    def update():
+        return "triggered"
+
+    # The callbacks are registered on compile, i.e. the first request has nothing left to resolve.
+    app.compile()
+    assert list(app.callback_map) == ["log.children"]
+    client = app.server.test_client()
+    assert client.get("/_dash-dependencies").json[0]["output"] == "log.children"
+    assert list(app.callback_map) == ["log.children"]
+    # Afterwards, callbacks are registered directly with Dash (as after the first request).
+    app = DashProxy(include_global_callbacks=False)
+    app.layout = html.Div([html.Div(id="log"), html.Div(id="other")])
+    app.compile()
+    app.callback(Output("log", "children"), Input("log", "id"))(lambda x: x)
+    assert list(app.callback_map) == ["log.children"]
+    # Callbacks added to the blueprint would not be resolved, which is an error on compile, but not on requests.
+    app.blueprint.callback(Output("other", "children"), Input("log", "id"))(lambda x: x)
+    with pytest.raises(RuntimeError):
+        app.compile()
+    client = app.server.test_client()
+    assert [client.get("/_dash-dependencies").status_code for _ in range(2)] == [200, 200]
+
+
+def test_dash_proxy_cached_responses():
+    app = DashProxy(include_global_callbacks=False)
+    app.layout = html.Div([html.Button(id="btn"), html.Div(id="log")])
+    _ = app.callback(Output("log", "children"), Input("btn", "n_clicks"))(lambda x: x)
+    app.compile()
+    client = app.server.test_client()
+    for route in ["/_dash-dependencies", "/_dash-layout"]:
+        response = client.get(route, headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.data)) == client.get(route).json
+        # Repeat requests are answered with 304 (Not Modified).
+        etag = response.headers["ETag"]
+        response = client.get(route, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert response.status_code == 304 and response.headers["ETag"] == etag
+    # Callbacks registered after the first request invalidate the cached dependencies.
+    _ = app.callback(Output("btn", "children"), Input("log", "children"))(lambda x: x)
+    response = client.get("/_dash-dependencies", headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 200 and len(response.json) == 2
+    # Layout functions are not cached.
+    app = DashProxy(include_global_callbacks=False)
+    app.layout = lambda: html.Div(id="log")
+    app.compile()
+    assert "ETag" not in app.server.test_client().get("/_dash-layout").headers
+
+
 # @pytest.mark.parametrize(
 #     "args, kwargs",
 #     [